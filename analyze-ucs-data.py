@@ -7,7 +7,88 @@ Shows column structure, data samples, and assesses value for merging
 import openpyxl
 import json
 from pathlib import Path
-from collections import defaultdict
+from itertools import chain, islice
+from collections import Counter
+
+try:
+    import pandas as pd
+except Exception:
+    pd = None
+
+# Rust-based calamine reader (pandas >= 2.2) parses XLSX much faster than openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except Exception:
+    EXCEL_ENGINE = "openpyxl"
+
+# Columns summarized under "Data Analysis" and the dtypes pandas parses them as
+ANALYSIS_DTYPES = {
+    'NORAD Number': 'Int64',
+    'Country/Org of UN Registry': 'string',
+    'Purpose': 'string',
+    'Class of Orbit': 'string',
+}
+
+# How many of the most common values to list per categorical column (None = all)
+TOP_VALUES = {
+    'Country/Org of UN Registry': 5,
+    'Purpose': 5,
+    'Class of Orbit': None,
+}
+
+def summarize_with_pandas(file_path, sheet_name, hdr_idx):
+    """Summarize the analysis columns with pandas, parsing only those columns
+
+    The sheet must have at least one of them; returns (row_count, summary).
+    """
+    wanted = {name: dtype for name, dtype in ANALYSIS_DTYPES.items() if name in hdr_idx}
+    df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=list(wanted),
+                       dtype=wanted, engine=EXCEL_ENGINE)
+
+    summary = {}
+    if 'NORAD Number' in wanted:
+        summary['NORAD Number'] = df['NORAD Number'].nunique()
+    for name, limit in TOP_VALUES.items():
+        if name in wanted:
+            counts = df[name].value_counts()
+            top = counts if limit is None else counts.head(limit)
+            summary[name] = (counts.size, list(top.items()))
+    return len(df), summary
+
+def summarize_rows(rows, hdr_idx):
+    """Summarize the analysis columns in a single pass over streamed rows"""
+    norad_col = hdr_idx.get('NORAD Number')
+    country_col = hdr_idx.get('Country/Org of UN Registry')
+    purpose_col = hdr_idx.get('Purpose')
+    orbit_col = hdr_idx.get('Class of Orbit')
+
+    row_count = 0
+    norad_ids = set()
+    countries = []
+    purposes = []
+    orbits = []
+    for row in rows:
+        row_count += 1
+        if norad_col is not None and row[norad_col]:
+            norad_ids.add(row[norad_col])
+        if country_col is not None and row[country_col]:
+            countries.append(row[country_col])
+        if purpose_col is not None and row[purpose_col]:
+            purposes.append(row[purpose_col])
+        if orbit_col is not None and row[orbit_col]:
+            orbits.append(row[orbit_col])
+
+    summary = {}
+    if norad_col is not None:
+        summary['NORAD Number'] = len(norad_ids)
+    for name, col, values in (('Country/Org of UN Registry', country_col, countries),
+                              ('Purpose', purpose_col, purposes),
+                              ('Class of Orbit', orbit_col, orbits)):
+        if col is not None:
+            counts = Counter(values)
+            summary[name] = (len(counts), counts.most_common(TOP_VALUES[name]))
+    return row_count, summary
 
 def analyze_xlsx(file_path):
     """Analyze an Excel file and return detailed info"""
@@ -15,37 +96,38 @@ def analyze_xlsx(file_path):
     print(f"Analyzing: {Path(file_path).name}")
     print(f"{'='*80}")
 
-    workbook = openpyxl.load_workbook(file_path, data_only=True)
+    workbook = openpyxl.load_workbook(file_path, data_only=True, read_only=True, keep_links=False)
 
     for sheet_name in workbook.sheetnames:
         sheet = workbook[sheet_name]
         print(f"\nSheet: {sheet_name}")
-        print(f"Dimensions: {sheet.dimensions}")
+        # force=True scans the sheet when the file doesn't record its dimensions
+        print(f"Dimensions: {sheet.calculate_dimension(force=True)}")
 
-        # Get headers (first row)
-        headers = []
-        for cell in sheet[1]:
-            headers.append(cell.value)
+        # Stream rows once; the first row holds the headers
+        rows = sheet.iter_rows(values_only=True)
+        headers = list(next(rows, ()))
 
         print(f"\nColumns ({len(headers)}):")
         for i, header in enumerate(headers, 1):
             print(f"  {i:2}. {header}")
 
-        # Count rows
-        row_count = sheet.max_row - 1  # Exclude header
-        print(f"\nTotal rows: {row_count:,}")
+        # Header -> tuple index, built once instead of scanning headers per field
+        hdr_idx = {header: i for i, header in enumerate(headers)}
 
         # Sample data from first few rows (rows 2-6)
-        print(f"\nSample data (first 5 records):")
-        sample_data = []
-        for row_num in range(2, min(7, sheet.max_row + 1)):
-            row_data = {}
-            for col_num, header in enumerate(headers, 1):
-                cell_value = sheet.cell(row_num, col_num).value
-                row_data[header] = cell_value
-            sample_data.append(row_data)
+        sample_rows = list(islice(rows, 5))
+        sample_data = [dict(zip(headers, row)) for row in sample_rows]
+
+        if pd is not None and hdr_idx.keys() & ANALYSIS_DTYPES.keys():
+            row_count, summary = summarize_with_pandas(file_path, sheet_name, hdr_idx)
+        else:
+            row_count, summary = summarize_rows(chain(sample_rows, rows), hdr_idx)
+
+        print(f"\nTotal rows: {row_count:,}")
 
         # Print sample in readable format
+        print(f"\nSample data (first 5 records):")
         for i, record in enumerate(sample_data, 1):
             print(f"\n  Record {i}:")
             for key, value in record.items():
@@ -56,53 +138,34 @@ def analyze_xlsx(file_path):
         print(f"\n\nData Analysis:")
 
         # Check for NORAD Cat IDs
-        if 'NORAD Number' in headers:
-            col_idx = headers.index('NORAD Number') + 1
-            norad_ids = set()
-            for row_num in range(2, sheet.max_row + 1):
-                val = sheet.cell(row_num, col_idx).value
-                if val:
-                    norad_ids.add(val)
-            print(f"  Unique NORAD IDs: {len(norad_ids):,}")
+        if 'NORAD Number' in summary:
+            print(f"  Unique NORAD IDs: {summary['NORAD Number']:,}")
 
         # Check for countries/operators
-        if 'Country/Org of UN Registry' in headers:
-            col_idx = headers.index('Country/Org of UN Registry') + 1
-            countries = defaultdict(int)
-            for row_num in range(2, sheet.max_row + 1):
-                val = sheet.cell(row_num, col_idx).value
-                if val:
-                    countries[val] += 1
-            print(f"  Countries/Orgs: {len(countries)}")
+        if 'Country/Org of UN Registry' in summary:
+            total, top = summary['Country/Org of UN Registry']
+            print(f"  Countries/Orgs: {total}")
             print(f"  Top 5:")
-            for country, count in sorted(countries.items(), key=lambda x: x[1], reverse=True)[:5]:
+            for country, count in top:
                 print(f"    {country}: {count}")
 
         # Check for purposes/applications
-        if 'Purpose' in headers:
-            col_idx = headers.index('Purpose') + 1
-            purposes = defaultdict(int)
-            for row_num in range(2, sheet.max_row + 1):
-                val = sheet.cell(row_num, col_idx).value
-                if val:
-                    purposes[val] += 1
-            print(f"  Purposes: {len(purposes)}")
+        if 'Purpose' in summary:
+            total, top = summary['Purpose']
+            print(f"  Purposes: {total}")
             print(f"  Top 5:")
-            for purpose, count in sorted(purposes.items(), key=lambda x: x[1], reverse=True)[:5]:
+            for purpose, count in top:
                 print(f"    {purpose}: {count}")
 
         # Check for orbit classes
-        if 'Class of Orbit' in headers:
-            col_idx = headers.index('Class of Orbit') + 1
-            orbits = defaultdict(int)
-            for row_num in range(2, sheet.max_row + 1):
-                val = sheet.cell(row_num, col_idx).value
-                if val:
-                    orbits[val] += 1
+        if 'Class of Orbit' in summary:
+            _, top = summary['Class of Orbit']
             print(f"  Orbit Classes:")
-            for orbit, count in sorted(orbits.items(), key=lambda x: x[1], reverse=True):
+            for orbit, count in top:
                 print(f"    {orbit}: {count}")
 
+    workbook.close()
+
 # Analyze both files
 files = [
     '/home/major/aetherlink/docs/UCS-Satellite-Database 5-1-2023.xlsx',
@@ -132,10 +195,13 @@ RECOMMENDATION:
 """)
 
 # Read one file to get actual column count
-wb = openpyxl.load_workbook('/home/major/aetherlink/docs/UCS-Satellite-Database 5-1-2023.xlsx', data_only=True)
+wb = openpyxl.load_workbook('/home/major/aetherlink/docs/UCS-Satellite-Database 5-1-2023.xlsx', data_only=True, read_only=True, keep_links=False)
 ws = wb.active
-headers = [cell.value for cell in ws[1]]
-row_count = ws.max_row - 1
+rows = ws.iter_rows(values_only=True)
+headers = next(rows, ())
+# read-only max_row is None for unsized sheets, so count the data rows instead
+row_count = sum(1 for _ in rows)
+wb.close()
 
 print(f"✓ MERGE - High value fields found:")
 print(f"  Total UCS records: {row_count:,}")
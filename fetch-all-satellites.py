@@ -4,16 +4,34 @@ Modified Space-Track.org data fetcher
 Based on SLTrack.py by Andrew Stokes
 Modified to fetch ALL active satellites (not just Starlink)
 
-Fetches satellite catalog and orbital data into JSON format
+Fetches satellite catalog and orbital data into line-delimited JSON
+(one record per line, zstd-compressed to *.ndjson.zst when zstandard is installed)
 Uses proven Space-Track.org query patterns that work reliably
+
+Re-running after an interruption resumes the OMM/SATCAT downloads, skipping
+satellites already saved; pass --fresh to discard earlier output and start over.
 """
 
-import requests
+import httpx
+import io
 import json
+import sys
 import time
+from collections import deque
 from datetime import datetime
+from typing import Deque
 import os
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import zstandard
+except Exception:
+    zstandard = None
+
 class MyError(Exception):
     def __init__(self, args):
         Exception.__init__(self, "Error: {0}".format(args))
@@ -28,20 +46,107 @@ requestCmdAction = "/basicspacedata/query"
 # Get all active satellites (no decay date) using tle_latest class
 requestFindActiveSats = "/class/tle_latest/ORDINAL/1/DECAY_DATE/null-val/format/json/orderby/NORAD_CAT_ID%20asc"
 
-# Get detailed OMM data for a specific satellite
-requestOMMSatellite = "/class/omm/NORAD_CAT_ID/{}/orderby/EPOCH%20desc/limit/1/format/json"
-
-# Get SATCAT data for a specific satellite
-requestSatcatSatellite = "/class/satcat/NORAD_CAT_ID/{}/format/json"
-
-# Credentials from environment
-username = os.environ.get('SPACETRACK_USERNAME', '.mil@mail.mil')
-password = os.environ.get('SPACETRACK_PASSWORD', 'K......########')
+# Get the latest OMM (general perturbations) data for a comma-separated batch of satellites
+requestOMMBatch = "/class/gp/NORAD_CAT_ID/{}/orderby/NORAD_CAT_ID%20asc/format/json"
+
+# Get SATCAT data for a comma-separated batch of satellites
+requestSatcatBatch = "/class/satcat/NORAD_CAT_ID/{}/orderby/NORAD_CAT_ID%20asc/format/json"
+
+# NORAD IDs per batched query (keeps the request URL well under server limits)
+BATCH_SIZE = 500
+
+# Rate limiting: Space-Track allows 20/min, we do 18/min to be safe
+RATE_LIMIT = 18
+RATE_WINDOW = 60.0
+
+# Monotonic timestamps of the requests made in the current rate window
+request_times: Deque[float] = deque()
+
+def json_loads(data):
+    """Parse a JSON response body; orjson accepts the raw bytes without decoding"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj):
+    """Serialize to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def ndjson_path(name):
+    """Output path for a dataset, with .zst appended when output is compressed"""
+    path = os.path.join(output_dir, name + '.ndjson')
+    return path + '.zst' if zstandard is not None else path
+
+def open_ndjson(path, append=False):
+    """Open an NDJSON output file for binary writes, zstd-compressing if available"""
+    if zstandard is not None:
+        # Appending starts a new zstd frame; concatenated frames decode as one stream
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'ab' if append else 'wb'))
+    f = open(path, 'a+b' if append else 'wb')
+    if append and f.tell() > 0:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b'\n':
+            f.write(b'\n')  # terminate a partial line left by an interrupted run
+    return f
+
+def read_saved_ids(path):
+    """NORAD_CAT_IDs already saved to an NDJSON output by an earlier run"""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, 'rb') as raw:
+        f = raw
+        if zstandard is not None:
+            f = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True))
+        try:
+            for line in f:
+                try:
+                    done.add(str(json_loads(line)['NORAD_CAT_ID']))
+                except (ValueError, KeyError):
+                    continue  # partial line from an interrupted write
+        except Exception as e:
+            print(f"      Warning: stopped reading {path} early ({e})")
+    return done
+
+def pending_batches(norad_ids, done):
+    """Split the IDs not saved yet into comma-separated query batches"""
+    pending = [n for n in norad_ids if str(n) not in done]
+    return [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+
+def make_client():
+    """Space-Track HTTP client; multiplexes over HTTP/2 when the h2 package is installed"""
+    try:
+        return httpx.Client(http2=True, base_url=uriBase, timeout=30)
+    except ImportError:
+        return httpx.Client(base_url=uriBase, timeout=30)
+
+def wait_for_rate_limit():
+    """Block until another request fits in the sliding rate window, then record it"""
+    now = time.monotonic()
+    while request_times and now - request_times[0] >= RATE_WINDOW:
+        request_times.popleft()
+    if len(request_times) >= RATE_LIMIT:
+        delay = RATE_WINDOW - (now - request_times[0])
+        print(f"      Rate limit: Sleeping {delay:.1f} seconds...")
+        time.sleep(delay)
+        request_times.popleft()
+    request_times.append(time.monotonic())
+
+# Credentials from environment (never hard-code them here)
+username = os.environ.get('SPACETRACK_USERNAME')
+password = os.environ.get('SPACETRACK_PASSWORD')
+if not username or not password:
+    raise MyError("SPACETRACK_USERNAME and SPACETRACK_PASSWORD must be set in the environment")
 siteCred = {'identity': username, 'password': password}
 
 output_dir = '/home/major/aetherlink/temp'
 os.makedirs(output_dir, exist_ok=True)
 
+# Start over instead of resuming from earlier output
+fresh = '--fresh' in sys.argv[1:]
+
 print("=" * 70)
 print("Space-Track.org Data Fetcher")
 print("=" * 70)
@@ -59,10 +164,10 @@ stats = {
     'start_time': time.time()
 }
 
-# Use requests session with Space-Track.org
-with requests.Session() as session:
+# Use one pooled keep-alive client for every Space-Track.org request
+with make_client() as session:
     print("[1/4] Logging in to Space-Track.org...")
-    resp = session.post(uriBase + requestLogin, data=siteCred)
+    resp = session.post(requestLogin, data=siteCred)
     if resp.status_code != 200:
         raise MyError(f"Login failed: HTTP {resp.status_code}")
 
@@ -80,7 +185,8 @@ with requests.Session() as session:
     print(f"      Query: {requestFindActiveSats}")
 
     # Get all active satellites using the PROVEN query pattern
-    resp = session.get(uriBase + requestCmdAction + requestFindActiveSats)
+    wait_for_rate_limit()
+    resp = session.get(requestCmdAction + requestFindActiveSats)
     if resp.status_code != 200:
         print(f"      ✗ HTTP {resp.status_code}")
         error_body = resp.text[:200]
@@ -88,16 +194,17 @@ with requests.Session() as session:
         raise MyError(f"Failed to fetch satellite list: HTTP {resp.status_code}")
 
     # Parse the satellite list
-    satellites = json.loads(resp.text)
+    satellites = json_loads(resp.content)
     stats['total_satellites'] = len(satellites)
     stats['tle_fetched'] = len(satellites)
 
     print(f"      ✓ Received {len(satellites)} active satellites")
 
     # Save the TLE data
-    tle_file = os.path.join(output_dir, 'satellites_tle.json')
-    with open(tle_file, 'w') as f:
-        json.dump(satellites, f, indent=2)
+    tle_file = ndjson_path('satellites_tle')
+    with open_ndjson(tle_file) as f:
+        for sat in satellites:
+            f.write(json_dumps(sat) + b'\n')
     print(f"      ✓ Saved to {tle_file}")
 
     # Extract NORAD_CAT_IDs for detailed queries
@@ -105,81 +212,66 @@ with requests.Session() as session:
 
     print()
     print(f"[3/4] Fetching detailed OMM data for {len(norad_ids)} satellites...")
-    print("      (This will take a while - rate limited to 18/min)")
-
-    omm_data = []
-    request_count = 0
-
-    for idx, norad_id in enumerate(norad_ids, 1):
-        # Rate limiting: Space-Track allows 20/min, we do 18/min to be safe
-        if request_count >= 18:
-            print(f"      Rate limit: Sleeping 60 seconds... ({idx}/{len(norad_ids)})")
-            time.sleep(60)
-            request_count = 0
-
-        # Fetch OMM data for this satellite
-        query = requestOMMSatellite.format(norad_id)
-        resp = session.get(uriBase + requestCmdAction + query)
-
-        if resp.status_code == 200:
-            data = json.loads(resp.text)
-            if data:  # Some satellites may not have OMM data
-                omm_data.extend(data)
-                stats['omm_fetched'] += 1
-            if idx % 100 == 0:
-                print(f"      Progress: {idx}/{len(norad_ids)} satellites ({stats['omm_fetched']} with OMM data)")
-        else:
-            stats['errors'] += 1
-            if idx % 100 == 0:
-                print(f"      Warning: HTTP {resp.status_code} for NORAD_CAT_ID={norad_id}")
-
-        request_count += 1
 
-    print(f"      ✓ Fetched OMM data for {stats['omm_fetched']} satellites")
+    # Resume: skip satellites whose OMM data an earlier run already saved
+    omm_file = ndjson_path('satellites_omm')
+    omm_done = set() if fresh else read_saved_ids(omm_file)
+    batches = pending_batches(norad_ids, omm_done)
+    stats['omm_fetched'] = sum(1 for n in norad_ids if str(n) in omm_done)
+    if stats['omm_fetched']:
+        print(f"      Resuming: {stats['omm_fetched']} satellites already saved")
+    print(f"      ({len(batches)} queries of up to {BATCH_SIZE} satellites - rate limited to {RATE_LIMIT}/min)")
+
+    with open_ndjson(omm_file, append=not fresh) as omm_out:
+        for idx, batch in enumerate(batches, 1):
+            # Fetch the latest OMM data for this batch of satellites
+            query = requestOMMBatch.format(','.join(str(n) for n in batch))
+            wait_for_rate_limit()
+            resp = session.get(requestCmdAction + query)
+
+            if resp.status_code == 200:
+                data = json_loads(resp.content)
+                # GP holds one record per object; some satellites may not have OMM data
+                for record in data:
+                    omm_out.write(json_dumps(record) + b'\n')
+                stats['omm_fetched'] += len(data)
+                print(f"      Progress: {idx}/{len(batches)} batches ({stats['omm_fetched']} with OMM data)")
+            else:
+                stats['errors'] += 1
+                print(f"      Warning: HTTP {resp.status_code} for NORAD_CAT_ID={batch[0]}..{batch[-1]}")
 
-    # Save OMM data
-    omm_file = os.path.join(output_dir, 'satellites_omm.json')
-    with open(omm_file, 'w') as f:
-        json.dump(omm_data, f, indent=2)
+    print(f"      ✓ Fetched OMM data for {stats['omm_fetched']} satellites")
     print(f"      ✓ Saved to {omm_file}")
 
     print()
     print(f"[4/4] Fetching SATCAT data for {len(norad_ids)} satellites...")
 
-    satcat_data = []
-    request_count = 0
-
-    for idx, norad_id in enumerate(norad_ids, 1):
-        # Rate limiting
-        if request_count >= 18:
-            print(f"      Rate limit: Sleeping 60 seconds... ({idx}/{len(norad_ids)})")
-            time.sleep(60)
-            request_count = 0
-
-        # Fetch SATCAT data for this satellite
-        query = requestSatcatSatellite.format(norad_id)
-        resp = session.get(uriBase + requestCmdAction + query)
-
-        if resp.status_code == 200:
-            data = json.loads(resp.text)
-            if data:
-                satcat_data.extend(data)
-                stats['satcat_fetched'] += 1
-            if idx % 100 == 0:
-                print(f"      Progress: {idx}/{len(norad_ids)} satellites ({stats['satcat_fetched']} with SATCAT data)")
-        else:
-            stats['errors'] += 1
-            if idx % 100 == 0:
-                print(f"      Warning: HTTP {resp.status_code} for NORAD_CAT_ID={norad_id}")
-
-        request_count += 1
+    # Resume: skip satellites whose SATCAT data an earlier run already saved
+    satcat_file = ndjson_path('satellites_satcat')
+    satcat_done = set() if fresh else read_saved_ids(satcat_file)
+    batches = pending_batches(norad_ids, satcat_done)
+    stats['satcat_fetched'] = sum(1 for n in norad_ids if str(n) in satcat_done)
+    if stats['satcat_fetched']:
+        print(f"      Resuming: {stats['satcat_fetched']} satellites already saved")
+
+    with open_ndjson(satcat_file, append=not fresh) as satcat_out:
+        for idx, batch in enumerate(batches, 1):
+            # Fetch SATCAT data for this batch of satellites
+            query = requestSatcatBatch.format(','.join(str(n) for n in batch))
+            wait_for_rate_limit()
+            resp = session.get(requestCmdAction + query)
+
+            if resp.status_code == 200:
+                data = json_loads(resp.content)
+                for record in data:
+                    satcat_out.write(json_dumps(record) + b'\n')
+                stats['satcat_fetched'] += len(data)
+                print(f"      Progress: {idx}/{len(batches)} batches ({stats['satcat_fetched']} with SATCAT data)")
+            else:
+                stats['errors'] += 1
+                print(f"      Warning: HTTP {resp.status_code} for NORAD_CAT_ID={batch[0]}..{batch[-1]}")
 
     print(f"      ✓ Fetched SATCAT data for {stats['satcat_fetched']} satellites")
-
-    # Save SATCAT data
-    satcat_file = os.path.join(output_dir, 'satellites_satcat.json')
-    with open(satcat_file, 'w') as f:
-        json.dump(satcat_data, f, indent=2)
     print(f"      ✓ Saved to {satcat_file}")
 
     session.close()
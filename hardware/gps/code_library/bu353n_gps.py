@@ -18,9 +18,11 @@ Notes:
 - For configuration changes, use SiRF binary protocol (not implemented here)
 """
 
+import re
 import threading
 import serial
-import time
+from functools import reduce
+from operator import xor
 from typing import Optional, Dict, Any, Callable, List
 
 # ---------------------------
@@ -31,24 +33,29 @@ DEFAULT_PORT = "/dev/gps"
 DEFAULT_BAUD = 4800
 READ_TIMEOUT = 1.0
 
+# Unterminated input kept by the reader before it is discarded (NMEA sentences are <= 82 bytes)
+MAX_PENDING = 4096
+
 # NMEA sentences commonly output by BU-353N
 NMEA_WANTED = ("GPGGA", "GPRMC", "GPGSA", "GPGSV", "GPGLL", "GPVTG")
 
+# Start of an NMEA sentence from a GPS/GNSS/GLONASS/Galileo talker, e.g. b"$GPRMC,"
+_NMEA_RE = re.compile(rb"\$G[PNLA][A-Z]{3},")
+
 def nmea_checksum_ok(line: str) -> bool:
     """
     Validate NMEA checksum. line should begin with '$' and contain '*CS'.
     """
     if not line.startswith("$") or "*" not in line:
         return False
-    body, cs = line[1:].split("*", 1)
-    calc = 0
-    for ch in body:
-        calc ^= ord(ch)
+    star = line.index("*")
     try:
-        got = int(cs[:2], 16)
-    except ValueError:
+        body = line[1:star].encode("ascii")
+        got = int(line[star + 1:star + 3], 16)
+    except (UnicodeEncodeError, ValueError):
         return False
-    return got == calc
+    # Iterating bytes yields ints directly, so the XOR fold needs no ord() per char
+    return got == reduce(xor, body, 0)
 
 def nmea_dm_to_deg(dm: str, hemi: str) -> Optional[float]:
     """
@@ -69,6 +76,15 @@ def nmea_dm_to_deg(dm: str, hemi: str) -> Optional[float]:
         val = -val
     return val
 
+def _guarded(cb: Callable[[bytes], None]) -> Callable[[bytes], None]:
+    """Wrap a subscriber so its exceptions never reach the reader thread."""
+    def call(raw: bytes):
+        try:
+            cb(raw)
+        except Exception:
+            pass
+    return call
+
 # ---------------------------
 # BU353NGPS class
 # ---------------------------
@@ -133,6 +149,12 @@ class BU353NGPS:
     def stop(self):
         """Stop background reader and close port."""
         self._stop.set()
+        # Wake a read() blocked in the reader thread instead of waiting out its timeout
+        if self.ser is not None:
+            try:
+                self.ser.cancel_read()
+            except Exception:
+                pass
         if self._th and self._th.is_alive():
             self._th.join(timeout=2.0)
         self._th = None
@@ -142,7 +164,7 @@ class BU353NGPS:
 
     def subscribe(self, cb: Callable[[bytes], None]):
         """Subscribe to raw incoming NMEA lines."""
-        self._subs.append(cb)
+        self._subs.append(_guarded(cb))
 
     # ---- info ----
 
@@ -156,55 +178,63 @@ class BU353NGPS:
         """Read NMEA sentences line by line."""
         assert self.ser is not None
         ser = self.ser
-        buf_line = bytearray()
-        while not self._stop.is_set():
+        # Bind hot attributes once; subs aliases the list, so later subscribe() calls still apply
+        subs = self._subs
+        stop_is_set = self._stop.is_set
+        read = ser.read
+        handle = self._handle_nmea
+        # Serial.readline() is io.IOBase.readline: one read(1) syscall per byte. Instead take
+        # everything already received in one read() (blocking for a byte only when idle)
+        # and split complete lines out of a local buffer.
+        buf = bytearray()
+        while not stop_is_set():
             try:
                 # Check if serial port is still open
                 if not ser.is_open:
                     print("GPS serial port closed, stopping reader loop")
                     break
-                b = ser.read(1)
+                chunk = read(ser.in_waiting or 1)
             except Exception as e:
                 print(f"GPS serial read error: {e}")
-                time.sleep(0.1)
+                self._stop.wait(0.1)
                 continue
-            if not b:
+            if not chunk:
                 continue
-            ch = b[0]
-            if ch == 0x24:  # '$' -> NMEA line
-                buf_line = bytearray(b)
-                # read until newline
-                while True:
-                    try:
-                        c = ser.read(1)
-                        if not c:
-                            break
-                        buf_line += c
-                        if c in (b'\n', b'\r'):
-                            break
-                    except Exception as e:
-                        print(f"GPS serial read error in NMEA parsing: {e}")
-                        break
-                line = buf_line.decode("ascii", errors="ignore").strip()
-                self._notify(line.encode("ascii", errors="ignore"))
-                self._handle_nmea(line)
-
-    def _notify(self, raw: bytes):
-        for cb in self._subs:
-            try:
-                cb(raw)
-            except Exception:
-                pass
+            buf += chunk
+            end = buf.rfind(b"\n")
+            if end < 0:
+                if len(buf) > MAX_PENDING:
+                    buf.clear()  # no line ending in sight (wrong baud / noise)
+                continue
+            lines = buf[:end].split(b"\n")
+            del buf[:end + 1]
+            for raw in lines:
+                # Drop anything before '$' (e.g. a partial sentence after open)
+                start = raw.find(b"$")
+                if start < 0:
+                    continue
+                line = raw[start:].decode("ascii", errors="ignore").strip()
+                if subs:
+                    data = line.encode("ascii")
+                    for cb in subs:
+                        cb(data)
+                handle(line)
 
     # ---- parsers ----
 
     def _handle_nmea(self, line: str):
-        if not line.startswith("$") or "*" not in line:
+        # Filter on sentence type first so GSV/GSA/VTG/GLL skip checksum and split entirely.
+        # Split only as far as the last field each sentence uses; the tail stays one string.
+        tag = line[1:6]
+        if tag in ("GPRMC", "GNRMC"):
+            maxsplit = 9
+        elif tag in ("GPGGA", "GNGGA"):
+            maxsplit = 10
+        else:
             return
         if not nmea_checksum_ok(line):
             return
-        tag = line[1:6]
-        fields = line.split(",")
+        fields = line.split(",", maxsplit)
 
         with self._lock:
             if tag in ("GPRMC", "GNRMC"):
@@ -281,22 +311,22 @@ class BU353NGPS:
         ports = ports or [self.port]
         bauds = bauds or [4800, 9600, 57600, 115200]
         for p in ports:
-            for b in bauds:
-                try:
-                    with serial.Serial(p, b, timeout=0.2) as s:
-                        t0 = time.time()
-                        got_nmea = False
-                        while time.time() - t0 < seconds_per_try:
-                            chunk = s.read(256)
-                            if not chunk:
-                                continue
-                            if b'$G' in chunk or b'$GP' in chunk:
-                                got_nmea = True
-                                break
-                        if got_nmea:
-                            # lock in
-                            self.port, self.baud = p, b
-                            return (p, b, "NMEA")
-                except Exception:
-                    continue
+            try:
+                s = serial.Serial(p, bauds[0], timeout=seconds_per_try)
+            except Exception:
+                continue
+            with s:
+                for b in bauds:
+                    try:
+                        # Re-clock the open port rather than reopening it per baud
+                        s.baudrate = b
+                        s.reset_input_buffer()
+                        # One blocking read: returns after 1024 bytes or seconds_per_try
+                        buf = s.read(1024)
+                    except Exception:
+                        continue
+                    if _NMEA_RE.search(buf):
+                        # lock in
+                        self.port, self.baud = p, b
+                        return (p, b, "NMEA")
         return None
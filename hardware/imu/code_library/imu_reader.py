@@ -14,6 +14,7 @@ Usage:
     python wt901c_test.py --configure               # Interactive configuration wizard
     python wt901c_test.py --json                    # JSON output (continuous)
     python wt901c_test.py --declination 3.1         # Apply local magnetic declination (deg)
+    python wt901c_test.py --level-tol 0.035         # Skip tilt compensation when held level
 """
 
 import argparse
@@ -22,7 +23,22 @@ import sys
 import json
 import math
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
 
 # Import from same code_library directory (relative import)
 from wt901c import (
@@ -34,34 +50,93 @@ from wt901c import (
 # ----------------------------- Heading helpers -----------------------------
 
 def _norm_deg(a: float) -> float:
+    # float % takes the divisor's sign, so the result is >= 0; a tiny negative a
+    # (e.g. -1e-17) rounds up to exactly 360.0, which is folded back to 0
     a %= 360.0
-    return a if a >= 0 else a + 360.0
+    return 0.0 if a == 360.0 else a
 
-def compute_heading_deg_from(accel: Accel, mag: Mag) -> float:
+def _heading_kernel(ax: float, ay: float, az: float,
+                    mx: float, my: float, mz: float, off_deg: float, level_tol_g: float) -> float:
+    """Tilt-compensated heading + off_deg (0..360) from raw accel and mag components."""
+    # Level (and upright) within level_tol_g: tilt compensation is ~identity, skip it
+    if abs(ax) < level_tol_g and abs(ay) < level_tol_g and az > 0.0:
+        return (math.degrees(math.atan2(-my, mx)) + off_deg) % 360.0
+
+    # roll, pitch from the gravity vector (atan2 is scale-free, so no normalization needed)
+    roll = math.atan2(ay, az)
+    pitch = math.atan2(-ax, math.hypot(ay, az))
+
+    # Tilt compensation of mag vector
+    sr = math.sin(roll)
+    cr = math.cos(roll)
+    sp = math.sin(pitch)
+    cp = math.cos(pitch)
+    mx2 = mx * cp + mz * sp
+    my2 = mx * sr * sp + my * cr - mz * sr * cp
+
+    # Heading: 0° = x+, increases clockwise; offset folded in before the single wrap
+    return (math.degrees(math.atan2(-my2, mx2)) + off_deg) % 360.0
+
+if njit is not None:
+    # Eager signature compiles at import, so the first display frame doesn't pay for the JIT
+    _heading_kernel = njit(
+        "float64(float64, float64, float64, float64, float64, float64, float64, float64)",
+        cache=True,
+    )(_heading_kernel)
+
+def compute_heading_deg_from(accel: Accel, mag: Mag, declination_deg: float = 0.0,
+                             level_tol_g: float = 0.0) -> float:
     """
     Tilt-compensated magnetic heading in degrees (0..360).
     Uses accel (to estimate roll/pitch) and raw mag counts.
+    Pass declination_deg to get the true heading instead.
+    level_tol_g > 0 skips tilt compensation while |ax| and |ay| are both below it
+    (0.035 g ~ 2°). That trades accuracy for speed: with a steep field a 2° tilt
+    can move the heading several degrees. 0 (default) always compensates.
     """
-    mx, my, mz = float(mag.mx), float(mag.my), float(mag.mz)
-    ax, ay, az = float(accel.ax_g), float(accel.ay_g), float(accel.az_g)
+    return _heading_kernel(float(accel.ax_g), float(accel.ay_g), float(accel.az_g),
+                           float(mag.mx), float(mag.my), float(mag.mz),
+                           float(declination_deg), float(level_tol_g))
 
-    # Normalize accelerometer (gravity vector)
-    g = math.sqrt(ax*ax + ay*ay + az*az) or 1.0
-    axn, ayn, azn = ax / g, ay / g, az / g
-
-    # roll, pitch from accel
-    roll  = math.atan2(ayn, azn)
-    pitch = math.atan2(-axn, math.sqrt(ayn*ayn + azn*azn))
+def compute_heading_deg_batch(accel_arr, mag_arr, declination_deg: float = 0.0):
+    """
+    Vectorized compute_heading_deg_from for N samples.
+    accel_arr / mag_arr are (N,3) arrays of (ax,ay,az) g and (mx,my,mz) counts.
+    Returns an (N,) array of headings (a list if numpy is unavailable).
+    """
+    if np is None:
+        return [_heading_kernel(a[0], a[1], a[2], m[0], m[1], m[2], declination_deg, 0.0)
+                for a, m in zip(accel_arr, mag_arr)]
+    acc = np.asarray(accel_arr, dtype=np.float64)
+    mag = np.asarray(mag_arr, dtype=np.float64)
+    ax, ay, az = acc[:, 0], acc[:, 1], acc[:, 2]
+    mx, my, mz = mag[:, 0], mag[:, 1], mag[:, 2]
+
+    roll = np.arctan2(ay, az)
+    pitch = np.arctan2(-ax, np.hypot(ay, az))
+    sr, cr = np.sin(roll), np.cos(roll)
+    sp, cp = np.sin(pitch), np.cos(pitch)
+    mx2 = mx * cp + mz * sp
+    my2 = mx * sr * sp + my * cr - mz * sr * cp
+    return (np.degrees(np.arctan2(-my2, mx2)) + declination_deg) % 360.0
+
+def _heading_memo(level_tol_g: float = 0.0) -> Callable[[Accel, Mag], float]:
+    """
+    compute_heading_deg_from for a display loop: when called again with the same
+    accel/mag packets (no new sample since the last tick) it returns the cached heading.
+    """
+    last_accel = last_mag = None
+    hmag = 0.0
 
-    # Tilt compensation of mag vector
-    mx2 = mx * math.cos(pitch) + mz * math.sin(pitch)
-    my2 = (mx * math.sin(roll) * math.sin(pitch)
-           + my * math.cos(roll)
-           - mz * math.sin(roll) * math.cos(pitch))
+    def heading(accel: Accel, mag: Mag) -> float:
+        nonlocal last_accel, last_mag, hmag
+        # Every frame is a new (frozen) packet object, so identity means "unchanged"
+        if accel is not last_accel or mag is not last_mag:
+            hmag = compute_heading_deg_from(accel, mag, 0.0, level_tol_g)
+            last_accel, last_mag = accel, mag
+        return hmag
 
-    # Heading: 0° = x+, increases clockwise
-    heading = math.degrees(math.atan2(-my2, mx2))
-    return _norm_deg(heading)
+    return heading
 
 def apply_declination(mag_heading: Optional[float], declination_deg: Optional[float]) -> Optional[float]:
     if mag_heading is None or declination_deg is None:
@@ -70,94 +145,145 @@ def apply_declination(mag_heading: Optional[float], declination_deg: Optional[fl
 
 # ------------------------------- Displays ----------------------------------
 
-def display_continuous(imu: WT901C, interval: float = 0.1, declination: Optional[float] = None):
+# The display loops wake on fresh packets (imu.wait) and fall back to `interval`
+# only when the IMU goes quiet. The JSON stream emits on any of these PIDs.
+JSON_PIDS = (PID.ACC, PID.GYRO, PID.ANG, PID.MAG, PID.QUAT)
+
+# Static banner rules, built once at import
+_BANNER_60 = "=" * 60
+_BANNER_80 = "=" * 80
+_BANNER_120 = "=" * 120
+
+# Status-line templates ('%' formatting is cheaper per call than f-strings or str.format)
+_FMT_ANGLES = "R:%6.1f° P:%6.1f° Y:%6.1f°"
+_FMT_ACC = "Acc:%5.2f,%5.2f,%5.2fg"
+_FMT_GYRO = "Gyro:%6.1f,%6.1f,%6.1f°/s"
+_FMT_MAG = "Mag:%6d,%6d,%6d"
+_FMT_HDG = "Hdg:%6.1f°"
+_FMT_TRUE = "True:%6.1f°"
+_FMT_HDG_MAG = "\rMagnetic: %7.2f°"
+_FMT_HDG_TRUE = "   True: %7.2f°"
+_FMT_ANGLES_ONLY = "\rRoll: %7.2f°  Pitch: %7.2f°  Yaw: %7.2f°  "
+
+# The \r status lines are written every tick but flushed (one write syscall)
+# at most this often; the terminal overwrites in place, so nothing visible is lost.
+_FLUSH_PERIOD_NS = 50_000_000  # 20 Hz
+
+def display_continuous(imu: WT901C, interval: float = 0.1, declination: Optional[float] = None,
+                       level_tol_g: float = 0.0):
     """Continuously display all sensor data"""
     print("WT901C-TTL IMU Monitor (Ctrl+C to stop)")
-    print("=" * 120)
-
+    print(_BANNER_120)
+
+    out = sys.stdout
+    monotonic_ns = time.monotonic_ns
+    next_flush = 0
+    heading = _heading_memo(level_tol_g)
+    # Loop-invariant method/enum lookups bound once
+    last_batch = imu.last_batch
+    wait = imu.wait
+    pid_mag = PID.MAG
     try:
         while True:
             # Get all latest data
-            accel = imu.last(PID.ACC)
-            gyro = imu.last(PID.GYRO)
-            angles = imu.last(PID.ANG)
-            mag = imu.last(PID.MAG)
+            accel, gyro, angles, mag, _ = last_batch()
 
             # Build status line
             parts = []
 
             if angles:
-                parts.append(f"R:{angles.roll_deg:6.1f}° P:{angles.pitch_deg:6.1f}° Y:{angles.yaw_deg:6.1f}°")
+                parts.append(_FMT_ANGLES % (angles.roll_deg, angles.pitch_deg, angles.yaw_deg))
 
             if accel:
-                parts.append(f"Acc:{accel.ax_g:5.2f},{accel.ay_g:5.2f},{accel.az_g:5.2f}g")
+                parts.append(_FMT_ACC % (accel.ax_g, accel.ay_g, accel.az_g))
 
             if gyro:
-                parts.append(f"Gyro:{gyro.gx_dps:6.1f},{gyro.gy_dps:6.1f},{gyro.gz_dps:6.1f}°/s")
+                parts.append(_FMT_GYRO % (gyro.gx_dps, gyro.gy_dps, gyro.gz_dps))
 
             if mag:
-                parts.append(f"Mag:{mag.mx:6d},{mag.my:6d},{mag.mz:6d}")
+                parts.append(_FMT_MAG % (mag.mx, mag.my, mag.mz))
 
             # Heading (tilt-compensated)
             if accel and mag:
-                hmag = compute_heading_deg_from(accel, mag)
-                parts.append(f"Hdg:{hmag:6.1f}°")
+                hmag = heading(accel, mag)
+                parts.append(_FMT_HDG % hmag)
                 if declination is not None:
-                    htrue = apply_declination(hmag, declination)
-                    parts.append(f"True:{htrue:6.1f}°")
+                    htrue = (hmag + declination) % 360.0
+                    parts.append(_FMT_TRUE % htrue)
 
-            if parts:
-                print(f"\r{' | '.join(parts)}", end="", flush=True)
-            else:
-                print(f"\rWaiting for data...", end="", flush=True)
+            out.write("\r" + " | ".join(parts) if parts else "\rWaiting for data...")
+            now = monotonic_ns()
+            if now >= next_flush:
+                out.flush()
+                next_flush = now + _FLUSH_PERIOD_NS
 
-            time.sleep(interval)
+            wait(pid_mag, timeout=interval)
 
     except KeyboardInterrupt:
         print("\n\nStopped.")
 
-def display_heading_only(imu: WT901C, interval: float = 0.05, declination: Optional[float] = None):
+def display_heading_only(imu: WT901C, interval: float = 0.05, declination: Optional[float] = None,
+                         level_tol_g: float = 0.0):
     """Continuous headings only (fast)"""
     print("WT901C Heading (Ctrl+C to stop)")
-    print("=" * 60)
-
+    print(_BANNER_60)
+
+    out = sys.stdout
+    monotonic_ns = time.monotonic_ns
+    next_flush = 0
+    heading = _heading_memo(level_tol_g)
+    last = imu.last
+    wait = imu.wait
+    pid_acc = PID.ACC
+    pid_mag = PID.MAG
     try:
         while True:
-            accel = imu.last(PID.ACC)
-            mag = imu.last(PID.MAG)
+            accel = last(pid_acc)
+            mag = last(pid_mag)
 
             if accel and mag:
-                hmag = compute_heading_deg_from(accel, mag)
-                line = f"\rMagnetic: {hmag:7.2f}°"
+                hmag = heading(accel, mag)
+                line = _FMT_HDG_MAG % hmag
                 if declination is not None:
-                    htrue = apply_declination(hmag, declination)
-                    line += f"   True: {htrue:7.2f}°"
-                print(line, end="", flush=True)
+                    htrue = (hmag + declination) % 360.0
+                    line += _FMT_HDG_TRUE % htrue
+                out.write(line)
             else:
-                print("\rWaiting for accel+mag...", end="", flush=True)
+                out.write("\rWaiting for accel+mag...")
+            now = monotonic_ns()
+            if now >= next_flush:
+                out.flush()
+                next_flush = now + _FLUSH_PERIOD_NS
 
-            time.sleep(interval)
+            wait(pid_mag, timeout=interval)
     except KeyboardInterrupt:
         print("\n\nStopped.")
 
 def display_angles_only(imu: WT901C, interval: float = 0.05):
     """Display angles only (high refresh rate)"""
     print("WT901C Angles (Ctrl+C to stop)")
-    print("=" * 60)
-
+    print(_BANNER_60)
+
+    out = sys.stdout
+    monotonic_ns = time.monotonic_ns
+    next_flush = 0
+    last = imu.last
+    wait = imu.wait
+    pid_ang = PID.ANG
     try:
         while True:
-            angles = imu.last(PID.ANG)
+            angles = last(pid_ang)
 
             if angles:
-                print(f"\rRoll: {angles.roll_deg:7.2f}°  "
-                      f"Pitch: {angles.pitch_deg:7.2f}°  "
-                      f"Yaw: {angles.yaw_deg:7.2f}°  ",
-                      end="", flush=True)
+                out.write(_FMT_ANGLES_ONLY % (angles.roll_deg, angles.pitch_deg, angles.yaw_deg))
             else:
-                print(f"\rWaiting for data...", end="", flush=True)
+                out.write("\rWaiting for data...")
+            now = monotonic_ns()
+            if now >= next_flush:
+                out.flush()
+                next_flush = now + _FLUSH_PERIOD_NS
 
-            time.sleep(interval)
+            wait(pid_ang, timeout=interval)
 
     except KeyboardInterrupt:
         print("\n\nStopped.")
@@ -165,12 +291,13 @@ def display_angles_only(imu: WT901C, interval: float = 0.05):
 def display_once(imu: WT901C, declination: Optional[float] = None):
     """Display detailed single reading"""
     print("\nWT901C-TTL IMU Status")
-    print("=" * 80)
+    print(_BANNER_80)
 
     time.sleep(0.5)  # Wait for data
+    s = imu.snapshot()  # one consistent view of every PID
 
     # Accelerometer
-    if accel := imu.last(PID.ACC):
+    if accel := s.acc:
         print(f"\n📊 Accelerometer:")
         print(f"  X: {accel.ax_g:7.3f} g")
         print(f"  Y: {accel.ay_g:7.3f} g")
@@ -180,7 +307,7 @@ def display_once(imu: WT901C, declination: Optional[float] = None):
         print(f"  Magnitude: {mag_g:.3f} g")
 
     # Gyroscope
-    if gyro := imu.last(PID.GYRO):
+    if gyro := s.gyro:
         print(f"\n🔄 Gyroscope:")
         print(f"  X: {gyro.gx_dps:7.2f} °/s")
         print(f"  Y: {gyro.gy_dps:7.2f} °/s")
@@ -188,14 +315,14 @@ def display_once(imu: WT901C, declination: Optional[float] = None):
         print(f"  Temperature: {gyro.temp_c:.1f}°C")
 
     # Angles
-    if angles := imu.last(PID.ANG):
+    if angles := s.ang:
         print(f"\n🧭 Orientation (Euler Angles):")
         print(f"  Roll:  {angles.roll_deg:7.2f}°")
         print(f"  Pitch: {angles.pitch_deg:7.2f}°")
         print(f"  Yaw:   {angles.yaw_deg:7.2f}°")
 
     # Quaternion
-    if quat := imu.last(PID.QUAT):
+    if quat := s.quat:
         print(f"\n🎯 Quaternion:")
         print(f"  q0 (w): {quat.q0:7.4f}")
         print(f"  q1 (x): {quat.q1:7.4f}")
@@ -204,10 +331,8 @@ def display_once(imu: WT901C, declination: Optional[float] = None):
         mag_q = (quat.q0**2 + quat.q1**2 + quat.q2**2 + quat.q3**2)**0.5
         print(f"  Magnitude: {mag_q:.4f} (should be ~1.0)")
 
-    # Magnetometer + heading
-    accel = imu.last(PID.ACC)
-    mag = imu.last(PID.MAG)
-    if mag:
+    # Magnetometer + heading (reuses the accel sample shown above)
+    if mag := s.mag:
         print(f"\n🧲 Magnetometer:")
         print(f"  X: {mag.mx:6d} LSB")
         print(f"  Y: {mag.my:6d} LSB")
@@ -216,17 +341,17 @@ def display_once(imu: WT901C, declination: Optional[float] = None):
             hmag = compute_heading_deg_from(accel, mag)
             print(f"  Tilt-compensated magnetic heading: {hmag:7.2f}°")
             if declination is not None:
-                htrue = apply_declination(hmag, declination)
+                htrue = (hmag + declination) % 360.0
                 print(f"  True heading (declination {declination:+.2f}°): {htrue:7.2f}°")
 
     # Barometer (if available)
-    if baro := imu.last(PID.BARO):
+    if baro := s.baro:
         print(f"\n🌡️  Barometer:")
         print(f"  Pressure: {baro.pressure_pa:.1f} Pa")
         print(f"  Altitude: {baro.altitude_m:.1f} m")
 
     # GPS (if available)
-    if gps := imu.last(PID.GPS):
+    if gps := s.gps:
         print(f"\n🛰️  GPS:")
         print(f"  Latitude:  {gps.lat_deg:.6f}°")
         print(f"  Longitude: {gps.lon_deg:.6f}°")
@@ -234,7 +359,7 @@ def display_once(imu: WT901C, declination: Optional[float] = None):
         print(f"  Yaw:       {gps.gps_yaw_deg:.1f}°")
         print(f"  Speed:     {gps.ground_speed_kmh:.1f} km/h")
 
-    if gps_acc := imu.last(PID.GPS2):
+    if gps_acc := s.gps2:
         print(f"\n📡 GPS Accuracy:")
         print(f"  PDOP: {gps_acc.pdop:.2f}")
         print(f"  HDOP: {gps_acc.hdop:.2f}")
@@ -242,58 +367,102 @@ def display_once(imu: WT901C, declination: Optional[float] = None):
         print(f"  Satellites: {gps_acc.num_satellites}")
 
     # Digital Ports (if available)
-    if ports := imu.last(PID.DPORT):
+    if ports := s.dport:
         print(f"\n🔌 Digital Ports:")
         print(f"  D0: {ports.d0}")
         print(f"  D1: {ports.d1}")
         print(f"  D2: {ports.d2}")
         print(f"  D3: {ports.d3}")
 
-    print("=" * 80)
-
-def display_json(imu: WT901C, interval: float = 0.1, declination: Optional[float] = None):
-    """Output data as JSON (continuous)"""
+    print(_BANNER_80)
+
+def display_json(imu: WT901C, interval: float = 0.1, declination: Optional[float] = None,
+                 level_tol_g: float = 0.0):
+    """Output data as JSON (one line per arriving sample)"""
+    # Per-sensor dicts are allocated once and refilled in place; `data` only
+    # holds the ones present this tick (insertion order = output key order).
+    accel_d = {"x": 0.0, "y": 0.0, "z": 0.0, "temp": 0.0}
+    gyro_d = {"x": 0.0, "y": 0.0, "z": 0.0, "temp": 0.0}
+    angles_d = {"roll": 0.0, "pitch": 0.0, "yaw": 0.0}
+    mag_d: Dict[str, int] = {"x": 0, "y": 0, "z": 0}
+    quat_d = {"q0": 0.0, "q1": 0.0, "q2": 0.0, "q3": 0.0}
+    data: Dict[str, Any] = {}
+
+    # orjson emits bytes: write them to the binary stream (text layer flushed first)
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None) if orjson is not None else None
+    heading = _heading_memo(level_tol_g)
+    last_batch = imu.last_batch
+    wait = imu.wait
     try:
         while True:
-            data = {}
+            data.clear()
+            accel, gyro, angles, mag, quat = last_batch()
 
-            if accel := imu.last(PID.ACC):
-                data["accel"] = {"x": accel.ax_g, "y": accel.ay_g, "z": accel.az_g, "temp": accel.temp_c}
+            if accel:
+                accel_d["x"] = accel.ax_g
+                accel_d["y"] = accel.ay_g
+                accel_d["z"] = accel.az_g
+                accel_d["temp"] = accel.temp_c
+                data["accel"] = accel_d
 
-            if gyro := imu.last(PID.GYRO):
-                data["gyro"] = {"x": gyro.gx_dps, "y": gyro.gy_dps, "z": gyro.gz_dps, "temp": gyro.temp_c}
+            if gyro:
+                gyro_d["x"] = gyro.gx_dps
+                gyro_d["y"] = gyro.gy_dps
+                gyro_d["z"] = gyro.gz_dps
+                gyro_d["temp"] = gyro.temp_c
+                data["gyro"] = gyro_d
 
-            if angles := imu.last(PID.ANG):
-                data["angles"] = {"roll": angles.roll_deg, "pitch": angles.pitch_deg, "yaw": angles.yaw_deg}
+            if angles:
+                angles_d["roll"] = angles.roll_deg
+                angles_d["pitch"] = angles.pitch_deg
+                angles_d["yaw"] = angles.yaw_deg
+                data["angles"] = angles_d
 
-            accel = imu.last(PID.ACC)
-            mag = imu.last(PID.MAG)
             if mag:
-                data["mag"] = {"x": mag.mx, "y": mag.my, "z": mag.mz}
+                mag_d["x"] = mag.mx
+                mag_d["y"] = mag.my
+                mag_d["z"] = mag.mz
+                data["mag"] = mag_d
                 if accel:
-                    hmag = compute_heading_deg_from(accel, mag)
+                    hmag = heading(accel, mag)
                     data["heading_mag_deg"] = hmag
                     if declination is not None:
-                        data["heading_true_deg"] = apply_declination(hmag, declination)
+                        data["heading_true_deg"] = (hmag + declination) % 360.0
 
-            if quat := imu.last(PID.QUAT):
-                data["quaternion"] = {"q0": quat.q0, "q1": quat.q1, "q2": quat.q2, "q3": quat.q3}
+            if quat:
+                quat_d["q0"] = quat.q0
+                quat_d["q1"] = quat.q1
+                quat_d["q2"] = quat.q2
+                quat_d["q3"] = quat.q3
+                data["quaternion"] = quat_d
 
             if data:
-                print(json.dumps(data))
+                if out is not None:
+                    out.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+                    out.flush()
+                else:
+                    print(json.dumps(data), flush=True)
 
-            time.sleep(interval)
+            # Emit only when a sample arrives: a stalled stream prints nothing rather
+            # than repeating the last record. `interval` only bounds each wait.
+            while wait(JSON_PIDS, timeout=interval) is None:
+                pass
 
     except KeyboardInterrupt:
         pass
 
 # ------------------------------- Calibration -------------------------------
 
+_HDR_ACCEL_CAL = f"\n{_BANNER_80}\nACCELEROMETER CALIBRATION\n{_BANNER_80}"
+_HDR_MAG_CAL = f"\n{_BANNER_80}\nMAGNETOMETER CALIBRATION\n{_BANNER_80}"
+_HDR_FULL_CAL = f"\n{_BANNER_80}\nFULL CALIBRATION SEQUENCE\n{_BANNER_80}"
+_HDR_ZERO_YAW = f"\n{_BANNER_80}\nZERO YAW ANGLE\n{_BANNER_80}"
+_HDR_CONFIG = f"\n{_BANNER_80}\nINTERACTIVE CONFIGURATION WIZARD\n{_BANNER_80}"
+
 def calibrate_accelerometer(imu: WT901C, duration: int):
     """Calibrate accelerometer"""
-    print("\n" + "=" * 80)
-    print("ACCELEROMETER CALIBRATION")
-    print("=" * 80)
+    print(_HDR_ACCEL_CAL)
     print("\n⚠️  IMPORTANT: Place IMU on a LEVEL SURFACE and keep COMPLETELY STILL\n")
     input("Press Enter when ready...")
 
@@ -302,9 +471,7 @@ def calibrate_accelerometer(imu: WT901C, duration: int):
 
 def calibrate_magnetometer(imu: WT901C, duration: int):
     """Calibrate magnetometer"""
-    print("\n" + "=" * 80)
-    print("MAGNETOMETER CALIBRATION")
-    print("=" * 80)
+    print(_HDR_MAG_CAL)
     print("\n⚠️  IMPORTANT: Rotate IMU in ALL directions (figure-8 patterns)")
     print("    Cover full 3D rotation space for best results\n")
     input("Press Enter to start...")
@@ -314,9 +481,7 @@ def calibrate_magnetometer(imu: WT901C, duration: int):
 
 def calibrate_full(imu: WT901C):
     """Full calibration sequence"""
-    print("\n" + "=" * 80)
-    print("FULL CALIBRATION SEQUENCE")
-    print("=" * 80)
+    print(_HDR_FULL_CAL)
 
     # Step 1: Accelerometer
     print("\n📍 Step 1: Accelerometer Calibration")
@@ -359,13 +524,11 @@ def calibrate_full(imu: WT901C):
     imu.lock()
 
     print("\n✅ Full calibration complete!")
-    print("=" * 80)
+    print(_BANNER_80)
 
 def zero_yaw(imu: WT901C):
     """Zero yaw angle"""
-    print("\n" + "=" * 80)
-    print("ZERO YAW ANGLE")
-    print("=" * 80)
+    print(_HDR_ZERO_YAW)
     print("\nPoint IMU in desired forward direction (0°)")
     input("Press Enter when ready...")
 
@@ -383,9 +546,7 @@ def zero_yaw(imu: WT901C):
 
 def interactive_config(imu: WT901C):
     """Interactive configuration wizard"""
-    print("\n" + "=" * 80)
-    print("INTERACTIVE CONFIGURATION WIZARD")
-    print("=" * 80)
+    print(_HDR_CONFIG)
 
     # Output rate
     print("\n📊 Output Rate")
@@ -432,7 +593,7 @@ def interactive_config(imu: WT901C):
     )
 
     print("\n✅ Configuration applied and saved!")
-    print("=" * 80)
+    print(_BANNER_80)
 
 # ----------------------------------- Main ----------------------------------
 
@@ -489,6 +650,8 @@ Examples:
 
     parser.add_argument("--declination", type=float, default=None,
                        help="Magnetic declination in degrees (adds true heading)")
+    parser.add_argument("--level-tol", type=float, default=0.0, metavar="G",
+                       help="Skip tilt compensation while |ax|,|ay| < G (e.g. 0.035; default: 0 = off)")
 
     args = parser.parse_args()
 
@@ -514,15 +677,15 @@ Examples:
         elif args.configure:
             interactive_config(imu)
         elif args.json:
-            display_json(imu, args.interval, args.declination)
+            display_json(imu, args.interval, args.declination, args.level_tol)
         elif args.once:
             display_once(imu, args.declination)
         elif args.angles:
             display_angles_only(imu, )
         elif args.heading_only:
-            display_heading_only(imu, max(0.02, args.interval), args.declination)
+            display_heading_only(imu, max(0.02, args.interval), args.declination, args.level_tol)
         else:
-            display_continuous(imu, args.interval, args.declination)
+            display_continuous(imu, args.interval, args.declination, args.level_tol)
 
     except KeyboardInterrupt:
         print("\n\nInterrupted by user.")
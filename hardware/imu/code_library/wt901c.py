@@ -32,21 +32,41 @@ If your device uses different scales, adjust SCALE_* below.
 
 from __future__ import annotations
 
+import os
+import re
+import select
+import sys
 import threading
 import time
 import struct
 import math
-from dataclasses import dataclass, asdict
+from collections import deque
+from types import SimpleNamespace
+from dataclasses import dataclass
 from enum import IntEnum
-from typing import Callable, Optional, Union, Tuple, Dict, Any
+from typing import Callable, Optional, Union, Tuple, Dict, Any, Iterable, cast
 from datetime import datetime, timezone
 
 import serial
 
+try:
+    from numba import njit
+except Exception:
+    njit = None
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 # ---------- Protocol & scaling ----------
 
 FRAME_HEAD = 0x55
 
+# Frame start: the 0x55 header followed by a packet ID in the 0x50..0x5A range.
+# Matching both bytes skips most 0x55 values that are really payload data.
+_FRAME_RE = re.compile(rb"\x55[\x50-\x5A]")
+
 class PID(IntEnum):
     TIME = 0x50
     ACC  = 0x51
@@ -60,6 +80,16 @@ class PID(IntEnum):
     QUAT = 0x59
     DPORT= 0x5A
 
+# Plain module globals for the PIDs read on every orientation update
+_PID_ACC = PID.ACC
+_PID_MAG = PID.MAG
+_PID_GYRO = PID.GYRO
+_PID_ANG = PID.ANG
+_PID_QUAT = PID.QUAT
+
+# (PID, attribute name) pairs for WT901C.snapshot(): s.acc, s.gyro, ..., s.gps2, s.dport
+_SNAPSHOT_FIELDS = tuple((p, p.name.lower()) for p in PID)
+
 # Typical WT901 scales (adjust if your firmware differs)
 SCALE_ACC_G      = 16.0 / 32768.0           # g
 SCALE_GYRO_DPS   = 2000.0 / 32768.0         # deg/sec
@@ -70,35 +100,62 @@ SCALE_ALT_M      = 0.01                     # device dependent
 
 # ---------- Data containers ----------
 
-@dataclass
+# Packets are immutable and dict-free: no per-instance __dict__ at 100-200 Hz,
+# and a published packet can be shared across threads as-is.
+# (slots= needs Python 3.10+; older interpreters just get frozen instances.)
+_PACKET_DC = {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+
+@dataclass(**_PACKET_DC)
 class Accel:
     ax_g: float
     ay_g: float
     az_g: float
     temp_c: float
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {"ax_g": self.ax_g, "ay_g": self.ay_g, "az_g": self.az_g, "temp_c": self.temp_c}
+
+@dataclass(**_PACKET_DC)
 class Gyro:
     gx_dps: float
     gy_dps: float
     gz_dps: float
     temp_c: float
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "gx_dps": self.gx_dps,
+            "gy_dps": self.gy_dps,
+            "gz_dps": self.gz_dps,
+            "temp_c": self.temp_c,
+        }
+
+@dataclass(**_PACKET_DC)
 class Angles:
     roll_deg: float
     pitch_deg: float
     yaw_deg: float
     temp_c: float
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "roll_deg": self.roll_deg,
+            "pitch_deg": self.pitch_deg,
+            "yaw_deg": self.yaw_deg,
+            "temp_c": self.temp_c,
+        }
+
+@dataclass(**_PACKET_DC)
 class Mag:
     mx: int
     my: int
     mz: int
     temp_c: float
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {"mx": self.mx, "my": self.my, "mz": self.mz, "temp_c": self.temp_c}
+
+@dataclass(**_PACKET_DC)
 class TimePacket:
     year: int
     month: int
@@ -108,19 +165,36 @@ class TimePacket:
     second: int
     millis: int
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "year": self.year,
+            "month": self.month,
+            "day": self.day,
+            "hour": self.hour,
+            "minute": self.minute,
+            "second": self.second,
+            "millis": self.millis,
+        }
+
+@dataclass(**_PACKET_DC)
 class Quaternion:
     q0: float
     q1: float
     q2: float
     q3: float
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {"q0": self.q0, "q1": self.q1, "q2": self.q2, "q3": self.q3}
+
+@dataclass(**_PACKET_DC)
 class PressureAlt:
     pressure_pa: float
     altitude_m: float
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {"pressure_pa": self.pressure_pa, "altitude_m": self.altitude_m}
+
+@dataclass(**_PACKET_DC)
 class GPSData:
     """GPS position data (0x57)"""
     lon_deg: float      # Longitude in degrees
@@ -129,7 +203,16 @@ class GPSData:
     gps_yaw_deg: float  # GPS heading in degrees
     ground_speed_kmh: float  # Ground speed in km/h
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "lon_deg": self.lon_deg,
+            "lat_deg": self.lat_deg,
+            "gps_height_m": self.gps_height_m,
+            "gps_yaw_deg": self.gps_yaw_deg,
+            "ground_speed_kmh": self.ground_speed_kmh,
+        }
+
+@dataclass(**_PACKET_DC)
 class GPSAccuracy:
     """GPS accuracy data (0x58)"""
     pdop: float         # Position dilution of precision
@@ -137,7 +220,15 @@ class GPSAccuracy:
     vdop: float         # Vertical dilution of precision
     num_satellites: int # Number of satellites
 
-@dataclass
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "pdop": self.pdop,
+            "hdop": self.hdop,
+            "vdop": self.vdop,
+            "num_satellites": self.num_satellites,
+        }
+
+@dataclass(**_PACKET_DC)
 class PortStatus:
     """Digital port status (0x5A)"""
     d0: int
@@ -145,11 +236,17 @@ class PortStatus:
     d2: int
     d3: int
 
+    def _to_dict(self) -> Dict[str, Any]:
+        return {"d0": self.d0, "d1": self.d1, "d2": self.d2, "d3": self.d3}
+
 Packet = Union[Accel, Gyro, Angles, Mag, TimePacket, Quaternion, PressureAlt, GPSData, GPSAccuracy, PortStatus]
 
+# WT901C.last_batch() result: (accel, gyro, angles, mag, quat)
+_Batch = Tuple[Optional[Accel], Optional[Gyro], Optional[Angles], Optional[Mag], Optional[Quaternion]]
+
 # ---------- NEW: Orientation result ----------
 
-@dataclass
+@dataclass(**_PACKET_DC)
 class Orientation:
     """Computed orientation fields in the DISH BODY frame."""
     heading_mag_deg: float
@@ -161,6 +258,18 @@ class Orientation:
     declination_timestamp_utc: Optional[str]  # ISO8601 or None
     heading_offset_deg: float
 
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "heading_mag_deg": self.heading_mag_deg,
+            "heading_true_deg": self.heading_true_deg,
+            "cross_level_deg": self.cross_level_deg,
+            "elevation_deg": self.elevation_deg,
+            "declination_deg": self.declination_deg,
+            "declination_source": self.declination_source,
+            "declination_timestamp_utc": self.declination_timestamp_utc,
+            "heading_offset_deg": self.heading_offset_deg,
+        }
+
 # ---------- Exceptions ----------
 
 class WT901Error(Exception): ...
@@ -175,103 +284,212 @@ def checksum8(data: bytes) -> int:
 
 # ---------- Parser for 0x55 frames ----------
 
-def _to_i16(b: bytes) -> int:
-    return struct.unpack("<h", b)[0]
-
-def _to_u16(b: bytes) -> int:
-    return struct.unpack("<H", b)[0]
-
-def _to_i32(b: bytes) -> int:
-    return struct.unpack("<i", b)[0]
-
-def _parse_payload(pid: int, payload: bytes) -> Optional[Packet]:
-    # payload is 9 bytes (little-endian shorts/ints)
-    if pid == PID.ACC:
-        ax = _to_i16(payload[0:2]) * SCALE_ACC_G
-        ay = _to_i16(payload[2:4]) * SCALE_ACC_G
-        az = _to_i16(payload[4:6]) * SCALE_ACC_G
-        t  = _to_i16(payload[6:8]) / 100.0
-        return Accel(ax, ay, az, t)
-
-    if pid == PID.GYRO:
-        gx = _to_i16(payload[0:2]) * SCALE_GYRO_DPS
-        gy = _to_i16(payload[2:4]) * SCALE_GYRO_DPS
-        gz = _to_i16(payload[4:6]) * SCALE_GYRO_DPS
-        t  = _to_i16(payload[6:8]) / 100.0
-        return Gyro(gx, gy, gz, t)
-
-    if pid == PID.ANG:
-        roll  = _to_i16(payload[0:2]) * SCALE_ANGLE_DEG
-        pitch = _to_i16(payload[2:4]) * SCALE_ANGLE_DEG
-        yaw   = _to_i16(payload[4:6]) * SCALE_ANGLE_DEG
-        t     = _to_i16(payload[6:8]) / 100.0
-        return Angles(roll, pitch, yaw, t)
-
-    if pid == PID.MAG:
-        mx = _to_i16(payload[0:2])
-        my = _to_i16(payload[2:4])
-        mz = _to_i16(payload[4:6])
-        t  = _to_i16(payload[6:8]) / 100.0
-        return Mag(mx, my, mz, t)
-
-    if pid == PID.TIME:
-        # Year(2B) Month Day Hour Minute Second ms(2B)
-        year   = _to_u16(payload[0:2])
-        month  = payload[2]
-        day    = payload[3]
-        hour   = payload[4]
-        minute = payload[5]
-        second = payload[6]
-        millis = _to_u16(payload[7:9])
-        return TimePacket(year, month, day, hour, minute, second, millis)
-
-    if pid == PID.QUAT:
-        q0 = _to_i16(payload[0:2]) * SCALE_QUAT
-        q1 = _to_i16(payload[2:4]) * SCALE_QUAT
-        q2 = _to_i16(payload[4:6]) * SCALE_QUAT
-        q3 = _to_i16(payload[6:8]) * SCALE_QUAT
-        return Quaternion(q0, q1, q2, q3)
-
-    if pid == PID.BARO:
-        pressure = _to_i32(payload[0:4]) * SCALE_PRESSURE_Pa
-        alt_m    = _to_i32(payload[4:8]) * SCALE_ALT_M
-        return PressureAlt(pressure, alt_m)
-
-    if pid == PID.GPS:
-        # GPS data layout varies by model; keep basic fields so APIs compile.
-        lon_raw = _to_i32(payload[0:4])
-        lat_raw = _to_i32(payload[4:8])
-        lon_deg = lon_raw / 1e7
-        lat_deg = lat_raw / 1e7
-        return GPSData(lon_deg, lat_deg, 0.0, 0.0, 0.0)
-
-    if pid == PID.GPS2:
-        pdop = _to_u16(payload[0:2]) / 100.0
-        hdop = _to_u16(payload[2:4]) / 100.0
-        vdop = _to_u16(payload[4:6]) / 100.0
-        nsats = _to_u16(payload[6:8])
-        return GPSAccuracy(pdop, hdop, vdop, nsats)
-
-    if pid == PID.DPORT:
-        d0 = _to_u16(payload[0:2])
-        d1 = _to_u16(payload[2:4])
-        d2 = _to_u16(payload[4:6])
-        d3 = _to_u16(payload[6:8])
-        return PortStatus(d0, d1, d2, d3)
-
-    return None
-
-def parse_frame(frame11: bytes) -> Tuple[PID, Optional[Packet]]:
-    """Parse an 11-byte 0x55 frame: [0]=0x55, [1]=pid, [2:10]=payload(9B), [10]=sum."""
+# Anything unpack_from() and indexing accept: a frame as bytes, or the receive
+# bytearray / a memoryview of it. Parsers read in place at an offset, never a slice.
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Payload layouts (8 bytes, little-endian), precompiled once and unpacked
+# straight out of the frame at offset 2 instead of slicing it field by field.
+_S_I16X4 = struct.Struct("<hhhh")     # ACC, GYRO, ANG, MAG, QUAT
+_S_U16X4 = struct.Struct("<HHHH")     # GPS2, DPORT
+_S_I32X2 = struct.Struct("<ii")       # BARO, GPS
+_S_TIME  = struct.Struct("<BBBBBBH")  # YY MM DD hh mm ss ms
+
+def _parse_acc(buf: Buffer, off: int) -> Accel:
+    ax, ay, az, t = _S_I16X4.unpack_from(buf, off)
+    return Accel(ax * SCALE_ACC_G, ay * SCALE_ACC_G, az * SCALE_ACC_G, t / 100.0)
+
+def _parse_gyro(buf: Buffer, off: int) -> Gyro:
+    gx, gy, gz, t = _S_I16X4.unpack_from(buf, off)
+    return Gyro(gx * SCALE_GYRO_DPS, gy * SCALE_GYRO_DPS, gz * SCALE_GYRO_DPS, t / 100.0)
+
+def _parse_ang(buf: Buffer, off: int) -> Angles:
+    roll, pitch, yaw, t = _S_I16X4.unpack_from(buf, off)
+    return Angles(roll * SCALE_ANGLE_DEG, pitch * SCALE_ANGLE_DEG, yaw * SCALE_ANGLE_DEG, t / 100.0)
+
+def _parse_mag(buf: Buffer, off: int) -> Mag:
+    mx, my, mz, t = _S_I16X4.unpack_from(buf, off)
+    return Mag(mx, my, mz, t / 100.0)
+
+def _parse_time(buf: Buffer, off: int) -> TimePacket:
+    # Year is sent as two digits (YY); millis is the trailing u16
+    yy, month, day, hour, minute, second, millis = _S_TIME.unpack_from(buf, off)
+    return TimePacket(2000 + yy, month, day, hour, minute, second, millis)
+
+def _parse_quat(buf: Buffer, off: int) -> Quaternion:
+    q0, q1, q2, q3 = _S_I16X4.unpack_from(buf, off)
+    return Quaternion(q0 * SCALE_QUAT, q1 * SCALE_QUAT, q2 * SCALE_QUAT, q3 * SCALE_QUAT)
+
+def _parse_baro(buf: Buffer, off: int) -> PressureAlt:
+    pressure, alt = _S_I32X2.unpack_from(buf, off)
+    return PressureAlt(pressure * SCALE_PRESSURE_Pa, alt * SCALE_ALT_M)
+
+def _parse_gps(buf: Buffer, off: int) -> GPSData:
+    # GPS data layout varies by model; keep basic fields so APIs compile.
+    lon_raw, lat_raw = _S_I32X2.unpack_from(buf, off)
+    return GPSData(lon_raw / 1e7, lat_raw / 1e7, 0.0, 0.0, 0.0)
+
+def _parse_gps2(buf: Buffer, off: int) -> GPSAccuracy:
+    pdop, hdop, vdop, nsats = _S_U16X4.unpack_from(buf, off)
+    return GPSAccuracy(pdop / 100.0, hdop / 100.0, vdop / 100.0, nsats)
+
+def _parse_dport(buf: Buffer, off: int) -> PortStatus:
+    return PortStatus(*_S_U16X4.unpack_from(buf, off))
+
+# parser(buf, off) decodes the 8-byte payload that starts at buf[off]
+PayloadParser = Callable[[Buffer, int], Packet]
+
+_PARSERS: Dict[int, PayloadParser] = {
+    PID.TIME:  _parse_time,
+    PID.ACC:   _parse_acc,
+    PID.GYRO:  _parse_gyro,
+    PID.ANG:   _parse_ang,
+    PID.MAG:   _parse_mag,
+    PID.BARO:  _parse_baro,
+    PID.GPS:   _parse_gps,
+    PID.GPS2:  _parse_gps2,
+    PID.QUAT:  _parse_quat,
+    PID.DPORT: _parse_dport,
+}
+
+def _parse_payload(pid: int, buf: Buffer, off: int = 2) -> Optional[Packet]:
+    """
+    Decode the payload starting at buf[off] (2 for a whole frame); None for packet IDs
+    without a parser. buf may be bytes, bytearray or memoryview; nothing is copied.
+    """
+    parser = _PARSERS.get(pid)
+    return parser(buf, off) if parser is not None else None
+
+def parse_frame(frame11: Buffer) -> Tuple[PID, Optional[Packet]]:
+    """
+    Parse an 11-byte 0x55 frame: [0]=0x55, [1]=pid, [2:10]=payload(8B), [10]=sum.
+    frame11 may be bytes, bytearray or a memoryview slice of a receive buffer.
+    """
     if len(frame11) != 11 or frame11[0] != FRAME_HEAD:
         raise WT901ProtocolError("Bad frame header/length")
-    if checksum8(frame11[0:10]) != frame11[10]:
+    # Sum the whole frame and take the checksum byte back out: no 10-byte slice per frame
+    if (sum(frame11) - frame11[10]) & 0xFF != frame11[10]:
         raise WT901ChecksumError("Checksum mismatch")
     pid = frame11[1]
-    payload = frame11[2:11-1]
-    pkt = _parse_payload(pid, payload)
+    pkt = _parse_payload(pid, frame11, 2)
     return PID(pid), pkt
 
+# Reader dispatch table indexed directly by the raw ID byte (all 256 values):
+# (PID member, parser or None) for known packet IDs, None otherwise.
+def _build_frame_table() -> Tuple[Optional[Tuple[PID, Optional[PayloadParser]]], ...]:
+    tbl: list = [None] * 256
+    for pid in PID:
+        tbl[pid] = (pid, _PARSERS.get(pid))
+    return tuple(tbl)
+
+_FRAME_TBL = _build_frame_table()
+
+def _try_parse_frame(buf: Buffer, off: int) -> Optional[Tuple[PID, Optional[Packet]]]:
+    """
+    Reader-side parse of the 11-byte frame at buf[off] (caller ensures 11 bytes are there).
+    Returns None for a bad header, checksum or packet ID instead of raising, so resyncing
+    through line noise doesn't build an exception per rejected frame.
+    """
+    end = off + 11
+    cs = buf[end - 1]
+    if buf[off] != FRAME_HEAD or (sum(buf[off:end]) - cs) & 0xFF != cs:
+        return None
+    entry = _FRAME_TBL[buf[off + 1]]
+    if entry is None:
+        return None
+    pid, parser = entry
+    return pid, (parser(buf, off + 2) if parser is not None else None)
+
+# ---------- Orientation kernel ----------
+
+def _fused_heading(ax: float, ay: float, az: float,
+                   mx: float, my: float, mz: float,
+                   R: Tuple[float, ...], mag_off_deg: float, true_off_deg: float,
+                   ) -> Tuple[float, float, float, float]:
+    """
+    Sensor accel/mag -> (heading_mag, heading_true, cross_level, elevation).
+    R is the Sensor->Body mount matrix flattened row-major to 9 floats.
+    mag_off_deg / true_off_deg are the total offsets added to the raw heading
+    (heading offset, and heading offset + declination).
+    Body roll is about X_body (boresight), pitch about Y_body (right);
+    elevation is -pitch so that it is positive when the boresight goes up.
+    """
+    # Sensor->Body
+    ax_b = R[0]*ax + R[1]*ay + R[2]*az
+    ay_b = R[3]*ax + R[4]*ay + R[5]*az
+    az_b = R[6]*ax + R[7]*ay + R[8]*az
+    mx_b = R[0]*mx + R[1]*my + R[2]*mz
+    my_b = R[3]*mx + R[4]*my + R[5]*mz
+    mz_b = R[6]*mx + R[7]*my + R[8]*mz
+
+    # Roll & pitch from the (normalized) gravity vector
+    g = math.sqrt(ax_b*ax_b + ay_b*ay_b + az_b*az_b)
+    if g == 0.0:
+        g = 1.0
+    axn = ax_b / g
+    ayn = ay_b / g
+    azn = az_b / g
+    roll = math.atan2(ayn, azn)
+    pitch = math.atan2(-axn, math.sqrt(ayn*ayn + azn*azn))
+
+    # Tilt-compensate magnetometer into horizontal plane:
+    #   [mx2]   [ cp     0    sp   ]   [mx_b]
+    #   [my2] = [ sr*sp  cr  -sr*cp] . [my_b]
+    #                                  [mz_b]
+    sr = math.sin(roll)
+    cr = math.cos(roll)
+    sp = math.sin(pitch)
+    cp = math.cos(pitch)
+    srsp = sr * sp
+    srcp = sr * cp
+    mx2 = cp * mx_b + sp * mz_b
+    my2 = srsp * mx_b + cr * my_b - srcp * mz_b
+
+    roll_deg = math.degrees(roll)
+    pitch_deg = math.degrees(pitch)
+    hdg_raw = math.degrees(math.atan2(-my2, mx2))
+    hdg_mag = (hdg_raw + mag_off_deg) % 360.0
+    hdg_true = (hdg_raw + true_off_deg) % 360.0
+    return (hdg_mag, hdg_true, roll_deg, -pitch_deg)
+
+if njit is not None:
+    # Eager signature compiles at import, so the first get_orientation() doesn't pay for the JIT.
+    # No cache=True: the cache pickles the module name, and this file is imported both as
+    # `wt901c` and as `<package>.wt901c`, so a cache written by one breaks the other.
+    _fused_heading = njit(
+        "UniTuple(float64, 4)(float64, float64, float64, float64, float64, float64,"
+        " UniTuple(float64, 9), float64, float64)",
+    )(_fused_heading)
+
+# ---------- Sample history (smoothed orientation) ----------
+
+SMOOTH_RING_LEN = 256  # ACC/MAG samples kept for get_orientation_smoothed()
+
+def _new_ring(dtype: str = "f8"):
+    """(N,3) array of `dtype` written round-robin when numpy is available, else a bounded deque."""
+    if np is not None:
+        return np.zeros((SMOOTH_RING_LEN, 3), dtype=dtype)
+    return deque(maxlen=SMOOTH_RING_LEN)
+
+def _ring_push(ring, count: int, x: float, y: float, z: float) -> None:
+    """Store sample number `count` (0-based, ever increasing)."""
+    if np is not None:
+        ring[count % SMOOTH_RING_LEN] = (x, y, z)
+    else:
+        ring.append((x, y, z))
+
+def _ring_mean(ring, count: int, n: int) -> Optional[Tuple[float, float, float]]:
+    """Per-axis mean of the newest n samples (fewer if not that many yet), or None if empty."""
+    n = min(n, count, SMOOTH_RING_LEN)
+    if n <= 0:
+        return None
+    if np is not None:
+        end = count % SMOOTH_RING_LEN
+        m = ring.take(np.arange(end - n, end), axis=0, mode="wrap").mean(axis=0, dtype=np.float64)
+        return (float(m[0]), float(m[1]), float(m[2]))
+    rows = list(ring)[-n:]
+    return tuple(sum(col) / n for col in zip(*rows))
+
 # ---------- Command helpers (register writes) ----------
 
 def cmd_frame(cmd: int, arg: int) -> bytes:
@@ -345,36 +563,75 @@ class WT901C:
     )
 
     @staticmethod
-    def _mul_Rv(R: Tuple[Tuple[float,float,float], ...], v: Tuple[float,float,float]) -> Tuple[float,float,float]:
-        return (
-            R[0][0]*v[0] + R[0][1]*v[1] + R[0][2]*v[2],
-            R[1][0]*v[0] + R[1][1]*v[1] + R[1][2]*v[2],
-            R[2][0]*v[0] + R[2][1]*v[1] + R[2][2]*v[2],
-        )
-
-    @staticmethod
-    def _norm_deg(a: float) -> float:
-        a %= 360.0
-        return a if a >= 0 else a + 360.0
+    def _flatten_mount(R: Tuple[Tuple[float,float,float], ...]) -> Tuple[float, ...]:
+        """Row-major 9-tuple of floats, the form _fused_heading takes."""
+        return tuple(float(R[i][j]) for i in range(3) for j in range(3))
 
     # -------------------------------------------------------------
 
     def __init__(self, port: str, baud: int = 115200, timeout: float = 0.2):
         self._ser = serial.Serial(port=port, baudrate=baud, timeout=timeout)
-        self._rx = bytearray()
+        # Fixed receive buffer filled in place with readinto(); frames are parsed
+        # straight out of it through the memoryview, never copied out first.
+        # Unread bytes are _rxbuf[_rxhead:_rxtail]; consuming a frame only moves _rxhead.
+        self._rxbuf = bytearray(4096)
+        self._rxmv = memoryview(self._rxbuf)
+        self._rxhead = 0
+        self._rxtail = 0
+
+        # POSIX fast path: poll the tty fd ourselves and readv() whatever is there
+        # straight into the buffer, bypassing pyserial's read() wrapper. The port is
+        # opened O_NONBLOCK by pyserial. Elsewhere (Windows) _fill() uses readinto().
+        self._poll = None
+        self._fd = -1  # only read when _poll is set
+        fd = getattr(self._ser, "fd", None)
+        if fd is not None and hasattr(select, "poll") and hasattr(os, "readv"):
+            self._fd = fd
+            self._poll = select.poll()
+            self._poll.register(fd, select.POLLIN)
+        self._poll_ms = -1 if timeout is None else int(timeout * 1000)
+        # Linux: ASYNC_LOW_LATENCY on the tty (e.g. FTDI latency timer 16 ms -> 1 ms) so
+        # bytes reach the poll() above as they arrive. Best-effort: ptys and some
+        # USB-serial drivers don't support TIOCSSERIAL.
+        if hasattr(self._ser, "set_low_latency_mode"):
+            try:
+                self._ser.set_low_latency_mode(True)
+            except Exception:
+                pass
+
         self._running = False
         self._th: Optional[threading.Thread] = None
         self._cb: Optional[Callable[[PID, Optional[Packet]], None]] = None
+        # Latest packet per PID. Single writer (the reader thread); packets are frozen
+        # and a dict item store is atomic, so readers look it up without locking.
         self._last: Dict[PID, Packet] = {}
+        # Guards the ACC/MAG smoothing history (ring rows + counts), not _last
         self._lock = threading.Lock()
+        # Notified by the reader after each batch of packets lands in _last (see wait())
+        self._new_data = threading.Condition(threading.Lock())
 
         # NEW: orientation/declination state
         self._R_mount = WT901C._R_MOUNT_DEFAULT
+        self._R_flat = WT901C._flatten_mount(self._R_mount)
         self._heading_offset_deg: float = 0.0
         self._declination_deg: float = 0.0
         self._declination_src: str = "manual"   # "manual" | "auto"
         self._declination_ts: Optional[datetime] = None
+        self._declination_ts_iso: Optional[str] = None
         self._declination_provider = None  # callable or None
+        # Bumped whenever mounting/offset/declination change (invalidates the orientation cache)
+        self._config_gen = 0
+        self._recompute_offsets()
+
+        # Recent ACC/MAG vectors (accel g, raw mag) for get_orientation_smoothed()
+        self._acc_ring = _new_ring()
+        # Raw MAG counts are int16 on the wire: store them as-is (1.5 KB instead of 6 KB)
+        self._mag_ring = _new_ring("<i2")
+        self._acc_count = 0
+        self._mag_count = 0
+
+        # Last get_orientation() result, keyed by (acc count, mag count, config gen)
+        self._orient_cache: Optional[Tuple[Tuple[int, int, int], Orientation]] = None
 
     # ---- lifecycle ----
 
@@ -390,6 +647,12 @@ class WT901C:
         self._running = False
         return self
 
+    @property
+    def reader_native_id(self) -> Optional[int]:
+        """OS thread id of the background reader (for affinity/priority tuning), or None if not running."""
+        th = self._th
+        return th.native_id if th is not None and th.is_alive() else None
+
     def close(self):
         try:
             self._ser.close()
@@ -403,8 +666,42 @@ class WT901C:
         self._cb = cb
 
     def last(self, pid: PID) -> Optional[Packet]:
+        return self._last.get(pid)
+
+    def last_batch(self) -> _Batch:
+        """Latest (accel, gyro, angles, mag, quat) in one call; None for PIDs not seen yet."""
+        get = self._last.get
+        # _last only ever holds the parser's packet type for each PID
+        return cast(_Batch, (get(_PID_ACC), get(_PID_GYRO), get(_PID_ANG), get(_PID_MAG), get(_PID_QUAT)))
+
+    def snapshot(self) -> SimpleNamespace:
+        """
+        Latest packet of every PID as attributes named after the PID (s.acc, s.mag,
+        s.gps2, ...; None if not seen yet). Copied under the lock the reader holds
+        while publishing a batch, so the values are mutually consistent.
+        """
         with self._lock:
-            return self._last.get(pid)
+            last = dict(self._last)
+        return SimpleNamespace(**{name: last.get(pid) for pid, name in _SNAPSHOT_FIELDS})
+
+    def wait(self, pid: Union[PID, Iterable[PID]], timeout: Optional[float] = None) -> Optional[Packet]:
+        """
+        Block until the reader thread publishes a new packet for `pid` (or for any
+        PID in an iterable of PIDs) and return it, or None on timeout.
+        """
+        pids = (pid,) if isinstance(pid, PID) else tuple(pid)
+        last = self._last
+        seen = [last.get(p) for p in pids]
+
+        def fresh():
+            for p, old in zip(pids, seen):
+                pkt = last.get(p)
+                if pkt is not None and pkt is not old:
+                    return pkt
+            return None
+
+        with self._new_data:
+            return self._new_data.wait_for(fresh, timeout)
 
     # ---- reading ----
 
@@ -412,74 +709,139 @@ class WT901C:
         """
         Synchronously read ONE frame (blocks). Use this if you don't want the background thread.
         """
-        end = time.monotonic() + timeout
-        while time.monotonic() < end:
-            f = self._read_one_frame(timeout=max(0.01, self._ser.timeout or 0.05))
-            if f is not None:
-                return f
-        return None
+        return self._read_one_frame(timeout=max(0.01, timeout))
 
     def _reader(self):
+        # Loop-invariant lookups bound once; _running is re-read every pass so stop() works.
+        fill = self._fill
+        drain = self._drain
         while self._running:
             try:
-                f = self._read_one_frame(timeout=self._ser.timeout or 0.05)
-                if f is None:
-                    continue
-                pid, pkt = f
-                with self._lock:
-                    if pkt is not None:
-                        self._last[pid] = pkt
-                if self._cb:
-                    try:
-                        self._cb(pid, pkt)
-                    except Exception:
-                        pass
+                fill()
+                drain()
             except Exception:
                 # swallow intermittent serial errors; user can stop() to quit
                 pass
 
-    def _read_one_frame(self, timeout: float) -> Optional[Tuple[PID, Optional[Packet]]]:
+    def _drain(self) -> None:
         """
-        Accumulate bytes, search for header 0x55, then read 10 more bytes.
-        Verify checksum, parse, and return (pid, packet) or None if timeout.
+        Parse every complete frame already buffered, publish them to _last (and the
+        ACC/MAG history, under a single lock acquire), then run the callback for each.
         """
-        t_end = time.monotonic() + timeout
-        ser = self._ser
-
-        while time.monotonic() < t_end:
-            data = ser.read(ser.in_waiting or 1)
-            if not data:
-                continue
-            self._rx += data
+        frames = []
+        nxt = self._next_buffered_frame
+        f = nxt()
+        while f is not None:
+            frames.append(f)
+            f = nxt()
+        if not frames:
+            return
 
-            # try to extract frames
-            while True:
-                # find header
+        last = self._last
+        with self._lock:
+            for pid, pkt in frames:
+                if pkt is None:
+                    continue
+                last[pid] = pkt
+                if pid == _PID_ACC:
+                    acc = cast(Accel, pkt)
+                    _ring_push(self._acc_ring, self._acc_count, acc.ax_g, acc.ay_g, acc.az_g)
+                    self._acc_count += 1
+                elif pid == _PID_MAG:
+                    mag = cast(Mag, pkt)
+                    _ring_push(self._mag_ring, self._mag_count, mag.mx, mag.my, mag.mz)
+                    self._mag_count += 1
+        with self._new_data:
+            self._new_data.notify_all()
+        cb = self._cb
+        if cb:
+            for pid, pkt in frames:
                 try:
-                    idx = self._rx.index(FRAME_HEAD.to_bytes(1, "little"))
-                except ValueError:
-                    # no header; keep last few bytes in buffer
-                    self._rx = self._rx[-1:]
-                    break
-
-                # need 11 bytes from header
-                if len(self._rx) - idx < 11:
-                    if idx > 0:
-                        self._rx = self._rx[idx:]  # trim before header
-                    break
+                    cb(pid, pkt)
+                except Exception:
+                    pass
 
-                frame = bytes(self._rx[idx:idx+11])
-                self._rx = self._rx[idx+11:]  # advance buffer
-
-                try:
-                    pid, pkt = parse_frame(frame)
-                    return pid, pkt
-                except WT901ChecksumError:
-                    continue
-                except WT901ProtocolError:
-                    continue
+    def _read_one_frame(self, timeout: float) -> Optional[Tuple[PID, Optional[Packet]]]:
+        """
+        Accumulate bytes, search for header 0x55, then read 10 more bytes.
+        Verify checksum, parse, and return (pid, packet) or None if timeout.
+        Frames left over in the buffer from an earlier read are returned first.
+        """
+        # Integer deadline, checked once per serial read (never while extracting frames)
+        t_end_ns = time.monotonic_ns() + int(timeout * 1e9)
+        while True:
+            f = self._next_buffered_frame()
+            if f is not None:
+                return f
+            if time.monotonic_ns() >= t_end_ns:
+                return None
+            self._fill()
+
+    def _next_buffered_frame(self) -> Optional[Tuple[PID, Optional[Packet]]]:
+        """Pop the next valid frame from the receive buffer; None when more bytes are needed."""
+        buf = self._rxbuf
+        head = self._rxhead
+        tail = self._rxtail
+        search = _FRAME_RE.search
+
+        while True:
+            # find header + plausible PID
+            m = search(buf, head, tail)
+            if m is None:
+                # no frame start; keep a trailing 0x55 whose PID byte is still in flight
+                if tail > head and buf[tail - 1] == FRAME_HEAD:
+                    self._rxhead = tail - 1
+                else:
+                    self._rxhead = self._rxtail = 0
+                return None
+            idx = m.start()
+
+            # need 11 bytes from header
+            if tail - idx < 11:
+                self._rxhead = idx  # drop the bytes before the header
+                return None
+
+            f = _try_parse_frame(self._rxmv, idx)
+            if f is not None:
+                self._rxhead = idx + 11  # advance past the frame
+                return f
+            # not a real frame start: resync from the next byte, so a stray 0x55
+            # doesn't swallow the genuine frame that follows it
+            head = idx + 1
 
-        return None
+    def _fill(self) -> int:
+        """
+        One read into the free end of the receive buffer. Takes whatever is waiting,
+        or blocks up to the port timeout for a single byte when the line is idle.
+        """
+        ser = self._ser
+        buf = self._rxbuf
+        size = len(buf)
+        head = self._rxhead
+        tail = self._rxtail
+
+        # Less than one frame is left over here; once the head has passed the middle,
+        # slide it back to the start so there is always room to read into.
+        if head > size // 2:
+            buf[:tail - head] = buf[head:tail]
+            tail -= head
+            self._rxhead = 0
+            self._rxtail = tail
+
+        poll = self._poll
+        if poll is not None:
+            if not poll.poll(self._poll_ms):
+                return 0
+            got = os.readv(self._fd, [self._rxmv[tail:]])
+            if not got:
+                # same condition pyserial reports (e.g. USB adapter unplugged)
+                raise serial.SerialException("device reports readiness to read but returned no data")
+        else:
+            # at most what is already waiting: read(n) blocks until n bytes or timeout
+            want = min(ser.in_waiting or 1, size - tail)
+            got = ser.readinto(self._rxmv[tail:tail + want]) or 0
+        self._rxtail = tail + got
+        return got
 
     # ---- commands ----
 
@@ -633,7 +995,8 @@ class WT901C:
         """Set magnetic declination in degrees (east positive)."""
         self._declination_deg = float(deg)
         self._declination_src = "manual"
-        self._declination_ts = datetime.now(timezone.utc)
+        self._set_declination_ts(datetime.now(timezone.utc))
+        self._recompute_offsets()
 
     def set_declination_provider(self, provider_fn: Callable[[float,float,float,Optional[datetime]], float]) -> None:
         """
@@ -655,12 +1018,17 @@ class WT901C:
         val = float(self._declination_provider(lat_deg, lon_deg, alt_m, dt))
         self._declination_deg = val
         self._declination_src = "auto"
-        self._declination_ts = dt or datetime.now(timezone.utc)
+        self._set_declination_ts(dt or datetime.now(timezone.utc))
+        self._recompute_offsets()
+
+    def _set_declination_ts(self, ts: datetime) -> None:
+        """Record when declination changed, formatting the ISO string once here rather than per read."""
+        self._declination_ts = ts
+        self._declination_ts_iso = ts.isoformat().replace("+00:00", "Z")
 
     def get_declination_info(self) -> Tuple[float, str, Optional[str]]:
         """Return (deg, source, timestamp_iso8601)."""
-        ts = self._declination_ts.isoformat().replace("+00:00", "Z") if self._declination_ts else None
-        return (self._declination_deg, self._declination_src, ts)
+        return (self._declination_deg, self._declination_src, self._declination_ts_iso)
 
     def set_heading_offset_deg(self, offset_deg: float) -> None:
         """
@@ -668,60 +1036,39 @@ class WT901C:
         usually chosen so that the current pose reads ~0°.
         """
         self._heading_offset_deg = float(offset_deg)
+        self._recompute_offsets()
+
+    def _recompute_offsets(self) -> None:
+        """Fold offset and declination into the two totals the heading kernel adds."""
+        self._mag_total_off = self._heading_offset_deg
+        self._true_total_off = self._heading_offset_deg + self._declination_deg
+        self._config_gen += 1
 
     def set_mount_matrix(self, R3x3: Tuple[Tuple[float,float,float], ...]) -> None:
         """
         Replace the default Sensor→Body rotation (3x3). Only needed if you change mechanical mounting.
         """
         self._R_mount = R3x3
-
-    @staticmethod
-    def _rpy_from_body_acc(ax: float, ay: float, az: float) -> Tuple[float, float]:
-        """
-        Compute body-frame roll (cross-level) and pitch (elevation basis) from accel.
-        roll  = rotation about X_body (boresight)
-        pitch = rotation about Y_body (right)
-        """
-        g = math.sqrt(ax*ax + ay*ay + az*az) or 1.0
-        axn, ayn, azn = ax/g, ay/g, az/g
-        roll  = math.degrees(math.atan2(ayn, azn))
-        pitch = math.degrees(math.atan2(-axn, math.sqrt(ayn*ayn + azn*azn)))
-        return roll, pitch
+        self._R_flat = WT901C._flatten_mount(R3x3)
+        self._config_gen += 1
 
     def _compute_heading_from_latest(self) -> Optional[Tuple[float,float,float,float]]:
         """
         Return (heading_mag, heading_true, cross_level, elevation) if ACC+MAG present, else None.
         Elevation is defined positive when boresight goes up.
         """
-        with self._lock:
-            acc = self._last.get(PID.ACC)
-            mag = self._last.get(PID.MAG)
-        if not isinstance(acc, Accel) or not isinstance(mag, Mag):
+        last = self._last
+        acc = last.get(_PID_ACC)
+        mag = last.get(_PID_MAG)
+        if acc is None or mag is None:
             return None
+        # _last only ever holds the parser's packet type for each PID
+        acc = cast(Accel, acc)
+        mag = cast(Mag, mag)
 
-        # Sensor→Body
-        ax_b, ay_b, az_b = WT901C._mul_Rv(self._R_mount, (acc.ax_g, acc.ay_g, acc.az_g))
-        mx_b, my_b, mz_b = WT901C._mul_Rv(self._R_mount, (float(mag.mx), float(mag.my), float(mag.mz)))
-
-        # Cross-level & Elevation from accel (body frame)
-        roll_deg, pitch_deg = WT901C._rpy_from_body_acc(ax_b, ay_b, az_b)
-        cross_level = roll_deg
-        elevation   = -pitch_deg  # positive up
-
-        # Tilt-compensate magnetometer into horizontal plane
-        roll = math.radians(roll_deg)
-        pitch= math.radians(pitch_deg)
-        mx2 =  mx_b * math.cos(pitch) + mz_b * math.sin(pitch)
-        my2 = (mx_b * math.sin(roll) * math.sin(pitch)
-               + my_b * math.cos(roll)
-               - mz_b * math.sin(roll) * math.cos(pitch))
-
-        hdg_mag = math.degrees(math.atan2(-my2, mx2))
-        hdg_mag = WT901C._norm_deg(hdg_mag + self._heading_offset_deg)
-
-        hdg_true = WT901C._norm_deg(hdg_mag + self._declination_deg)
-
-        return (hdg_mag, hdg_true, cross_level, elevation)
+        return _fused_heading(acc.ax_g, acc.ay_g, acc.az_g,
+                              float(mag.mx), float(mag.my), float(mag.mz),
+                              self._R_flat, self._mag_total_off, self._true_total_off)
 
     def get_orientation(self) -> Optional[Orientation]:
         """
@@ -737,10 +1084,39 @@ class WT901C:
         2) Whenever your GPS module (e.g., M9N) publishes a fresh fix, call:
               imu.update_declination_from_gps(lat, lon, alt_m, gps_time)
            This updates the internal declination used here.
+
+        The result is cached until a new ACC or MAG packet arrives (or the
+        mounting/offset/declination changes), so polling faster than the
+        sensor output rate doesn't redo the trig.
         """
+        key = (self._acc_count, self._mag_count, self._config_gen)
+        cached = self._orient_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         vals = self._compute_heading_from_latest()
         if vals is None:
             return None
+        o = self._make_orientation(vals)
+        self._orient_cache = (key, o)
+        return o
+
+    def get_orientation_smoothed(self, n_samples: int = 50) -> Optional[Orientation]:
+        """
+        Like get_orientation(), but from the mean of the last `n_samples` ACC and MAG
+        vectors (at most SMOOTH_RING_LEN) instead of the latest single packets.
+        Averaging the vectors (not the angles) keeps this well-behaved across 0/360°.
+        Only samples received by the background reader (start()) are recorded.
+        """
+        with self._lock:
+            acc = _ring_mean(self._acc_ring, self._acc_count, n_samples)
+            mag = _ring_mean(self._mag_ring, self._mag_count, n_samples)
+        if acc is None or mag is None:
+            return None
+        vals = _fused_heading(acc[0], acc[1], acc[2], mag[0], mag[1], mag[2],
+                              self._R_flat, self._mag_total_off, self._true_total_off)
+        return self._make_orientation(vals)
+
+    def _make_orientation(self, vals: Tuple[float, float, float, float]) -> Orientation:
         hdg_mag, hdg_true, cross_level, elevation = vals
         dec_deg, dec_src, dec_ts = self.get_declination_info()
         return Orientation(
@@ -757,4 +1133,4 @@ class WT901C:
     def orientation_json(self) -> Optional[Dict[str, Any]]:
         """Same as get_orientation(), but as a dict (safe for telemetry JSON)."""
         o = self.get_orientation()
-        return asdict(o) if o else None
+        return o._to_dict() if o else None
@@ -9,6 +9,7 @@ GET  /snapshot?types=ang,gyro,acc,mag,...  -> Latest data snapshot (all types)
 GET  /last/{name}                          -> Latest single packet (ang, gyro, acc, mag, baro, quat, time, gps, gps2, dport, orientation)
 GET  /sse?types=ang,gyro,orientation       -> Server-Sent Events (JSON lines; now supports 'orientation')
 WS   /ws                                   -> WebSocket streaming JSON packets as they arrive
+                                              (MessagePack binary frames if the client offers the "msgpack" subprotocol)
 GET  /debug/stats                          -> Packet rates and ages
 
 Orientation (NEW)
@@ -35,6 +36,12 @@ Run
 ---
 IMU_PORT=/dev/imu IMU_BAUD=9600 python -m back_end.hardware.imu.wt901c_api --host 0.0.0.0 --port 8080
 
+On a busy host, --reader-cpu / --loop-cpu pin the serial reader thread and the
+event loop to separate cores, and --reader-rt-prio runs the reader under
+SCHED_FIFO (Linux; needs CAP_SYS_NICE). All are best-effort and off by default.
+Worker threads the loop starts later (asyncio.to_thread, used by calibration)
+inherit the --loop-cpu mask.
+
 Docs
 ----
 Visit http://localhost:8080/docs for interactive Swagger UI.
@@ -42,6 +49,7 @@ Visit http://localhost:8080/docs for interactive Swagger UI.
 Requirements
 ------------
 pip install fastapi uvicorn
+Optional: orjson (faster JSON), msgpack (binary WebSocket frames)
 """
 
 from __future__ import annotations
@@ -51,20 +59,32 @@ import json
 import asyncio
 import argparse
 import contextlib
+import functools
+import threading
 import time
 from contextlib import asynccontextmanager
-from collections import defaultdict
+from collections import defaultdict, deque
 from pathlib import Path
 from dataclasses import asdict, is_dataclass
-from typing import Dict, Optional, Set, Tuple, Iterable, List, cast, Any
+from typing import Callable, Dict, Optional, Tuple, Iterable, List, cast, Any
 from datetime import datetime
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import msgpack
+except Exception:
+    msgpack = None
+
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Body
 from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, Response, RedirectResponse
+from fastapi.responses import Response, RedirectResponse
 from fastapi.openapi.docs import get_swagger_ui_html
 
 # Import the upgraded driver (has Orientation + declination hooks)
@@ -76,7 +96,8 @@ from .wt901c import (
 
 # ---------- Helpers ----------
 
-PID_NAME = {
+# Keyed by PID, but also looked up with plain int PID bytes (PID is an IntEnum)
+PID_NAME: Dict[int, str] = {
     PID.TIME: "time",
     PID.ACC:  "acc",
     PID.GYRO: "gyro",
@@ -88,64 +109,204 @@ PID_NAME = {
     PID.QUAT: "quat",
     PID.DPORT:"dport",
 }
+# Stream name for every possible PID byte, indexed by int(pid); unknown PIDs read as "0xNN"
+_PID_NAMES: Tuple[str, ...] = tuple(PID_NAME.get(i, f"0x{i:02X}") for i in range(256))
 # include 'orientation' as a pseudo-stream type
 SELECTABLE = ("time", "acc", "gyro", "ang", "mag", "baro", "quat", "gps", "gps2", "dport", "orientation")
+_ALL_TYPES = frozenset(SELECTABLE)
+
+@functools.lru_cache(maxsize=64)
+def _parse_types(q: Optional[str]) -> frozenset:
+    """`types=acc,MAG` query value -> frozenset of lowercase names (all when empty)."""
+    if not q:
+        return _ALL_TYPES
+    return frozenset(t.lower() for t in q.split(","))
+
+def _type_set(types: Optional[Iterable[str]]) -> frozenset:
+    if not types:
+        return _ALL_TYPES
+    if isinstance(types, frozenset):
+        return types  # already normalized by _parse_types
+    return frozenset(t.lower() for t in types)
+
+# Window over which /debug/stats rates are measured (seconds)
+RATE_WINDOW_S = 1.0
+
+# Per-WS backlog; when a slow client falls this far behind, its oldest frames are dropped
+WS_QUEUE_MAX = 64
+
+# WebSocket subprotocol for MessagePack frames (same message dicts as the JSON stream)
+WS_MSGPACK = "msgpack"
+
+# SSE heartbeat, sent when a stream has been idle for a while
+SSE_PING = b"event: ping\ndata: {}\n\n"
+# Sent with the initial snapshot: browsers wait 5 s before reconnecting a dropped stream
+SSE_RETRY = b"retry: 5000\n"
+
+def _dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _json_response(obj: Any) -> Response:
+    """
+    JSON response encoded by _dumps. Skips FastAPI's jsonable_encoder walk,
+    which is not needed for these plain dicts of scalars.
+    """
+    return Response(_dumps(obj), media_type="application/json")
+
+def _tune_thread(tid: int, cpu: Optional[int] = None, rt_prio: int = 0) -> None:
+    """Best-effort: pin native thread `tid` to `cpu` and/or give it SCHED_FIFO `rt_prio`."""
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        with contextlib.suppress(OSError):
+            os.sched_setaffinity(tid, {cpu})
+    if rt_prio > 0 and hasattr(os, "sched_setscheduler"):
+        with contextlib.suppress(OSError):  # PermissionError without CAP_SYS_NICE
+            os.sched_setscheduler(tid, os.SCHED_FIFO, os.sched_param(rt_prio))
+
+def _offer(q: asyncio.Queue, item: Any) -> None:
+    """put_nowait, evicting the oldest queued item if the subscriber is full (live data wins)."""
+    try:
+        q.put_nowait(item)
+    except asyncio.QueueFull:
+        with contextlib.suppress(asyncio.QueueEmpty):
+            q.get_nowait()
+        q.put_nowait(item)
 
 def packet_to_dict(pid: PID, pkt: Optional[Packet]) -> Optional[Dict]:
     if pkt is None:
         return None
-    d = asdict(pkt) if is_dataclass(pkt) else {"raw": repr(pkt)}
-    name = PID_NAME.get(pid, f"0x{int(pid):02X}")
+    h = _PID_HANDLERS[pid]
+    return h(pkt) if h is not None else _packet_dict(_PID_NAMES[pid], pkt)
+
+def _packet_dict(name: str, pkt: Packet) -> Dict:
+    to_dict = getattr(pkt, "_to_dict", None)
+    if to_dict is not None:
+        d = to_dict()
+    else:
+        d = asdict(pkt) if is_dataclass(pkt) else {"raw": repr(pkt)}
     # Hide flaky ANG temp if present
     if name == "ang" and "temp_c" in d:
         d.pop("temp_c", None)
     d["_pid"] = name
     return d
 
+# Per-PID converters for the known packet types, indexed by int(pid) like _PID_NAMES
+def _tagged(name: str) -> Callable[[Packet], Dict]:
+    def handler(pkt: Packet) -> Dict:
+        d = pkt._to_dict()
+        d["_pid"] = name
+        return d
+    return handler
+
+def _ang_dict(pkt: Packet) -> Dict:
+    # Only registered for PID.ANG; flaky ANG temp left out
+    ang = cast(Angles, pkt)
+    return {"roll_deg": ang.roll_deg, "pitch_deg": ang.pitch_deg, "yaw_deg": ang.yaw_deg, "_pid": "ang"}
+
+_PID_HANDLERS: Tuple[Optional[Callable[[Packet], Dict]], ...] = tuple(
+    _ang_dict if i == PID.ANG else (_tagged(PID_NAME[i]) if i in PID_NAME else None)
+    for i in range(256)
+)
+
 # ---------- Hub (bridges driver thread -> asyncio) ----------
 
 class IMUHub:
-    def __init__(self, port: str, baud: int = 115200, timeout: float = 0.2):
+    def __init__(self, port: str, baud: int = 115200, timeout: float = 0.2,
+                 reader_cpu: Optional[int] = None, reader_rt_prio: int = 0):
         self.port = port
         self.baud = baud
         self.timeout = timeout
+        self.reader_cpu = reader_cpu
+        self.reader_rt_prio = reader_rt_prio
 
         self.imu = WT901C(port=port, baud=baud, timeout=timeout)
         self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_tid: Optional[int] = None
+        # Packets waiting for the loop; one scheduled _drain_inbox covers the whole batch
+        self._inbox: deque = deque()
+        self._inbox_lock = threading.Lock()
+        self._flush_scheduled = False
+        # Orientation inputs seen since the last recompute (touched on the loop thread only)
+        self._acc_dirty = False
+        self._mag_dirty = False
 
         self.latest: Dict[str, Dict[str, Any]] = {}
-        self.sse_subs: Set[asyncio.Queue] = set()
-        self.ws_subs: Set[WebSocket] = set()
+        # WS subscriber queues, filled by _publish with the JSON text (or MessagePack
+        # bytes) encoded once per packet
+        self.ws_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self.ws_msgpack_queues: Dict[WebSocket, asyncio.Queue] = {}
+        # SSE is a broadcast: _publish bumps _seq, keeps the newest frame per type
+        # and pulses _tick; each stream sends whatever changed since it last looked.
+        self.sse_count = 0
+        self._seq = 0
+        self._sse_frames: Dict[str, Tuple[int, bytes]] = {}
+        self._tick: Optional[asyncio.Event] = None
         self._started = False
 
         # Stats
         self.counts = defaultdict(int)
         self.first_mono = time.monotonic()
         self.last_mono: Dict[str, float] = {}
+        # Packets/s per stream over the last RATE_WINDOW_S, refreshed by _update_rates
+        self.rates: Dict[str, float] = {}
+        self._rate_counts: Dict[str, int] = {}
+        self._rate_mono = self.first_mono
+        self._rate_timer: Optional[asyncio.TimerHandle] = None
 
         # IMU → asyncio callback
         def cb(pid: PID, pkt: Optional[Packet]):
-            payload = packet_to_dict(pid, pkt)
-            if payload is None:
+            if pkt is None:
                 return
-            name = PID_NAME.get(pid, f"0x{int(pid):02X}")
-            msg = {"type": name, "data": payload, "ts": time.monotonic()}
-            if self.loop:
-                self.loop.call_soon_threadsafe(self._publish, name, msg)
-
-            # Each time new sensor data arrives, try to compute orientation
-            if self.loop and name in ("acc", "mag"):  # recompute when inputs change
-                self.loop.call_soon_threadsafe(self._publish_orientation)
+            name = _PID_NAMES[pid]
+            h = _PID_HANDLERS[pid]
+            data = h(pkt) if h is not None else _packet_dict(name, pkt)
+            msg = {"type": name, "data": data, "ts": time.monotonic()}
+            loop = self.loop
+            if not loop:
+                return
+            with self._inbox_lock:
+                self._inbox.append((name, msg))
+                if self._flush_scheduled:
+                    return
+                self._flush_scheduled = True
+            # Skip the self-pipe wakeup when already on the loop thread
+            if threading.get_ident() == self._loop_tid:
+                loop.call_soon(self._drain_inbox)
+            else:
+                loop.call_soon_threadsafe(self._drain_inbox)
 
         self.imu.on_packet(cb)
 
+    def _drain_inbox(self):
+        with self._inbox_lock:
+            batch, self._inbox = self._inbox, deque()
+            self._flush_scheduled = False
+        for name, msg in batch:
+            self._on_packet(name, msg)
+
+    def _on_packet(self, name: str, msg: Dict):
+        self._publish(name, msg)
+        # Recompute orientation once per fresh ACC+MAG pair rather than on each input
+        if name == "acc":
+            self._acc_dirty = True
+        elif name == "mag":
+            self._mag_dirty = True
+        else:
+            return
+        if self._acc_dirty and self._mag_dirty:
+            self._acc_dirty = self._mag_dirty = False
+            self._publish_orientation(msg["ts"])
+
     # Orientation recompute + publish as a pseudo-packet
-    def _publish_orientation(self):
+    def _publish_orientation(self, ts: Optional[float] = None):
         o = self.imu.orientation_json()
         if not o:
             return
         name = "orientation"
-        msg = {"type": name, "data": o, "ts": time.monotonic()}
+        # Streamed updates carry the timestamp of the ACC/MAG packet that completed the pair
+        msg = {"type": name, "data": o, "ts": time.monotonic() if ts is None else ts}
         self._publish(name, msg)
 
     def set_output_content_mask(self, mask: int) -> None:
@@ -156,18 +317,41 @@ class IMUHub:
 
     # ---- lifecycle ----
     def attach_loop(self, loop: asyncio.AbstractEventLoop):
+        """Bind to `loop`; must be called from the thread that runs it."""
         self.loop = loop
+        self._loop_tid = threading.get_ident()
+        # Created here, not in __init__: before 3.10 an Event binds to the loop current at creation
+        self._tick = asyncio.Event()
 
     def start(self):
         if not self._started:
             self.imu.start()
             self._started = True
+            tid = self.imu.reader_native_id
+            if tid is not None and (self.reader_cpu is not None or self.reader_rt_prio > 0):
+                _tune_thread(tid, self.reader_cpu, self.reader_rt_prio)
+            if self.loop:
+                self._rate_mono = time.monotonic()
+                self._rate_timer = self.loop.call_later(RATE_WINDOW_S, self._update_rates)
 
     def stop(self):
         if self._started:
+            if self._rate_timer:
+                self._rate_timer.cancel()
+                self._rate_timer = None
             self.imu.stop()
             self._started = False
 
+    def _update_rates(self):
+        now = time.monotonic()
+        dt = max(1e-6, now - self._rate_mono)
+        prev = self._rate_counts
+        counts = dict(self.counts)
+        self.rates = {k: (n - prev.get(k, 0)) / dt for k, n in counts.items()}
+        self._rate_counts = counts
+        self._rate_mono = now
+        self._rate_timer = self.loop.call_later(RATE_WINDOW_S, self._update_rates)
+
     def close(self):
         self.imu.close()
 
@@ -175,65 +359,108 @@ class IMUHub:
     def _publish(self, name: str, msg: Dict):
         self.latest[name] = msg
         self.counts[name] += 1
-        self.last_mono[name] = time.monotonic()
+        self.last_mono[name] = msg["ts"]
+
+        self._seq += 1
+
+        # Serialize once for every subscriber
+        if self.sse_count or self.ws_queues:
+            encoded = _dumps(msg)
+
+            # SSE (wake every stream at once; set() resolves the current waiters)
+            if self.sse_count:
+                self._sse_frames[name] = (self._seq, b"data: " + encoded + b"\n\n")
+                tick = self._tick
+                assert tick is not None  # created by attach_loop before any stream starts
+                tick.set()
+                tick.clear()
+
+            # WS (each socket's handler drains its own queue, see ws_drain)
+            if self.ws_queues:
+                text = encoded.decode("utf-8")
+                for q in self.ws_queues.values():
+                    _offer(q, text)
+
+        if self.ws_msgpack_queues:
+            packed = msgpack.packb(msg)
+            for q in self.ws_msgpack_queues.values():
+                _offer(q, packed)
+
+    async def ws_drain(self, ws: WebSocket, binary: bool = False) -> None:
+        """
+        Register `ws` and send it every published packet (MessagePack bytes if
+        `binary`, else JSON text); returns once the client goes away.
+        """
+        q: asyncio.Queue = asyncio.Queue(maxsize=WS_QUEUE_MAX)
+        queues = self.ws_msgpack_queues if binary else self.ws_queues
+        send = ws.send_bytes if binary else ws.send_text
 
-        # SSE
-        dead: List[asyncio.Queue] = []
-        for q in self.sse_subs:
-            try:
-                q.put_nowait(msg)
-            except asyncio.QueueFull:
+        async def send_loop():
+            while True:
+                await send(await q.get())
+
+        async def recv_loop():
+            # Reading is what surfaces the client's close frame; inbound messages are ignored
+            while (await ws.receive())["type"] != "websocket.disconnect":
                 pass
-            except Exception:
-                dead.append(q)
-        for q in dead:
-            self.sse_subs.discard(q)
-
-        # WS
-        async def _send(ws: WebSocket, payload: Dict):
-            with contextlib.suppress(Exception):
-                await ws.send_json(payload)
-        for ws in list(self.ws_subs):
-            try:
-                asyncio.create_task(_send(ws, msg))
-            except Exception:
-                self.ws_subs.discard(ws)
+
+        queues[ws] = q
+        tasks = [asyncio.create_task(send_loop()), asyncio.create_task(recv_loop())]
+        try:
+            # Either side ending (close frame, failed send) tears the socket down
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            queues.pop(ws, None)
+            for t in tasks:
+                if t.done():
+                    if not t.cancelled():
+                        t.exception()  # a failed send just means the client is gone
+                else:
+                    t.cancel()
 
     # ---- snapshots ----
     def snapshot(self, types: Iterable[str]) -> Dict[str, Dict]:
-        out: Dict[str, Dict] = {}
-        for t in types:
-            t = t.lower()
-            if t in self.latest:
-                out[t] = self.latest[t]
-        return {"ts": {"mono": asyncio.get_running_loop().time()}, **out}
+        wanted = _type_set(types)
+        out = {t: m for t, m in self.latest.items() if t in wanted}
+        return {"ts": {"mono": time.monotonic()}, **out}
 
     async def sse_stream(self, types: Iterable[str]):
-        """Async generator for SSE."""
-        wanted = set(t.lower() for t in types) if types else set(SELECTABLE)
-        q: asyncio.Queue = asyncio.Queue(maxsize=100)
-        self.sse_subs.add(q)
+        """
+        Async generator for SSE. A slow client is never queued up: after each
+        write it gets the newest frame of every type that changed meanwhile.
+        """
+        wanted = _type_set(types)
+        frames = self._sse_frames
+        tick = self._tick
+        assert tick is not None  # created by attach_loop
+        self.sse_count += 1
         try:
             # Initial snapshot
+            last_seen = self._seq
             snap = self.snapshot(wanted)
-            yield f"data: {json.dumps(snap)}\n\n"
-            # Stream updates
+            yield SSE_RETRY + b"data: " + _dumps(snap) + b"\n\n"
+            # Stream updates (frames arrive pre-encoded from _publish)
             while True:
-                try:
-                    msg = await asyncio.wait_for(q.get(), timeout=5.0)
-                    if msg["type"] in wanted:
-                        yield f"data: {json.dumps(msg)}\n\n"
-                except asyncio.TimeoutError:
-                    # heartbeat
-                    yield "event: ping\ndata: {}\n\n"
+                if self._seq == last_seen:
+                    try:
+                        await asyncio.wait_for(tick.wait(), timeout=5.0)
+                    except asyncio.TimeoutError:
+                        # heartbeat
+                        yield SSE_PING
+                        continue
+                fresh = sorted(sf for t, sf in frames.items() if sf[0] > last_seen and t in wanted)
+                last_seen = self._seq
+                if fresh:
+                    yield b"".join(f for _, f in fresh)
         finally:
-            self.sse_subs.discard(q)
+            self.sse_count -= 1
 
 # ---------- App factory ----------
 
-def create_app(port: str, baud: int) -> FastAPI:
+def create_app(port: str, baud: int, reader_cpu: Optional[int] = None,
+               reader_rt_prio: int = 0, loop_cpu: Optional[int] = None) -> FastAPI:
     try:
-        hub = IMUHub(port=port, baud=baud)
+        hub = IMUHub(port=port, baud=baud, reader_cpu=reader_cpu, reader_rt_prio=reader_rt_prio)
     except Exception as e:
         app = FastAPI(title="WT901C-TTL 9-axis IMU API (error)")
         @app.get("/health")
@@ -244,6 +471,12 @@ def create_app(port: str, baud: int) -> FastAPI:
     async def lifespan(app: FastAPI):
         hub.attach_loop(asyncio.get_running_loop())
         hub.start()
+        # Pin the loop only after hub.start(): a new thread inherits its creator's
+        # affinity, so pinning first would put the reader on the loop's core too.
+        # Threads started later from the loop (asyncio.to_thread, e.g. calibration)
+        # do inherit loop_cpu.
+        if loop_cpu is not None:
+            _tune_thread(threading.get_native_id(), cpu=loop_cpu)
         try:
             yield
         finally:
@@ -268,11 +501,17 @@ def create_app(port: str, baud: int) -> FastAPI:
     # ---- Favicon & images (serve from your repo path) ----
     ICON_FILE = Path("/home/major/Desktop/aetherlink/images/icons/IMU_Icon.png")
     app.mount("/images", StaticFiles(directory="/home/major/Desktop/aetherlink/images"), name="images")
+    # Read once; the icon is small and static, so requests never touch the disk
+    try:
+        favicon_png: Optional[bytes] = ICON_FILE.read_bytes()
+    except OSError:
+        favicon_png = None
 
     @app.get("/favicon.ico", include_in_schema=False)
     def favicon():
-        if ICON_FILE.exists():
-            return FileResponse(str(ICON_FILE), media_type="image/png")
+        if favicon_png is not None:
+            return Response(favicon_png, media_type="image/png",
+                            headers={"Cache-Control": "public, max-age=86400"})
         return Response(status_code=204)
 
     @app.get("/docs", include_in_schema=False)
@@ -293,21 +532,22 @@ def create_app(port: str, baud: int) -> FastAPI:
 
     @app.get("/snapshot")
     async def snapshot(types: Optional[str] = None):
-        wanted = types.split(",") if types else SELECTABLE
-        return hub.snapshot(wanted)
+        wanted = _parse_types(types)
+        return _json_response(hub.snapshot(wanted))
 
     @app.get("/last/{name}")
     async def last(name: str):
         n = name.lower()
-        if n not in SELECTABLE:
-            raise HTTPException(404, f"Unknown type '{name}'. Valid: {', '.join(SELECTABLE)}")
-        if n not in hub.latest:
+        msg = hub.latest.get(n) if n in _ALL_TYPES else None
+        if msg is None:
+            if n not in _ALL_TYPES:
+                raise HTTPException(404, f"Unknown type '{name}'. Valid: {', '.join(SELECTABLE)}")
             raise HTTPException(404, f"No data yet for '{name}'.")
-        return hub.latest[n]
+        return _json_response(msg)
 
     @app.get("/sse")
     async def sse(types: Optional[str] = None):
-        wanted = types.split(",") if types else SELECTABLE
+        wanted = _parse_types(types)
         async def event_gen():
             async for chunk in hub.sse_stream(wanted):
                 yield chunk
@@ -315,23 +555,18 @@ def create_app(port: str, baud: int) -> FastAPI:
 
     @app.websocket("/ws")
     async def ws(websocket: WebSocket):
-        await websocket.accept()
-        hub.ws_subs.add(websocket)
-        try:
-            while True:
-                await asyncio.sleep(60)
-        except WebSocketDisconnect:
-            pass
-        finally:
-            hub.ws_subs.discard(websocket)
+        # Clients offering the "msgpack" subprotocol get binary frames (when msgpack is installed)
+        binary = msgpack is not None and WS_MSGPACK in websocket.scope.get("subprotocols", ())
+        await websocket.accept(subprotocol=WS_MSGPACK if binary else None)
+        with contextlib.suppress(WebSocketDisconnect, RuntimeError, OSError):
+            await hub.ws_drain(websocket, binary)
 
     @app.get("/debug/stats")
     async def stats():
         now = time.monotonic()
-        uptime = now - hub.first_mono
-        rates = {k: hub.counts[k] / max(1e-6, uptime) for k in hub.counts}
-        ages  = {k: (now - hub.last_mono[k]) for k in hub.last_mono}
-        return {"uptime_s": uptime, "rates_fps": rates, "ages_s": ages}
+        ages = {k: now - t for k, t in hub.last_mono.items()}
+        # rates_fps: packets/s over the last RATE_WINDOW_S (refreshed in the background)
+        return _json_response({"uptime_s": now - hub.first_mono, "rates_fps": hub.rates, "ages_s": ages})
 
     @app.get("/health")
     async def health():
@@ -497,7 +732,7 @@ def create_app(port: str, baud: int) -> FastAPI:
         o = hub.imu.orientation_json()
         if not o:
             raise HTTPException(404, "Orientation not available yet (need ACC+MAG).")
-        return o
+        return _json_response(o)
 
     @app.post("/orientation/declination/{deg}")
     async def set_declination_manual(deg: float):
@@ -568,7 +803,11 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=8000)
     parser.add_argument("--serial", default=_env_or("/dev/imu", "IMU_PORT"))
     parser.add_argument("--baud", type=int, default=int(_env_or("115200", "IMU_BAUD")))
+    parser.add_argument("--reader-cpu", type=int, default=None, help="Pin the serial reader thread to this CPU")
+    parser.add_argument("--reader-rt-prio", type=int, default=0, help="SCHED_FIFO priority for the reader (1-99; 0 = off)")
+    parser.add_argument("--loop-cpu", type=int, default=None, help="Pin the event loop thread (and workers it starts) to this CPU")
     args = parser.parse_args()
 
-    app = create_app(port=args.serial, baud=args.baud)
+    app = create_app(port=args.serial, baud=args.baud, reader_cpu=args.reader_cpu,
+                     reader_rt_prio=args.reader_rt_prio, loop_cpu=args.loop_cpu)
     uvicorn.run(app, host=args.host, port=args.port, log_level="info")
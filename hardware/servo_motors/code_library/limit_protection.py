@@ -29,8 +29,9 @@ Key Features:
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional, Callable, Dict, List
+from typing import Optional, Callable, Dict, List, Union
 from enum import IntEnum
+import math
 import time
 import logging
 
@@ -89,10 +90,27 @@ class MotorLimits:
     recovery_distance: float = 2.0  # degrees to back off on limit hit
     recovery_speed: int = 100  # RPM for recovery moves
 
+    def __post_init__(self):
+        """
+        Precompute the bounds checked on every poll; ±inf stands in for "no limit".
+        Re-run after changing min_angle, max_angle or warning_margin
+        (LimitProtectionSystem.update_motor_limits does this).
+        """
+        self._eff_min = self.min_angle if self.min_angle is not None else -math.inf
+        self._eff_max = self.max_angle if self.max_angle is not None else math.inf
+        self._warn_min = self._eff_min + self.warning_margin
+        self._warn_max = self._eff_max - self.warning_margin
+
 
 @dataclass
 class LimitStatus:
-    """Current limit status for a motor."""
+    """
+    Current limit status for a motor.
+
+    LimitProtectionSystem keeps one instance per motor and refills it on every
+    check, so a returned status is only valid until the next check of that
+    motor. Use dataclasses.replace(status) to keep a copy.
+    """
     violation_type: LimitViolationType = LimitViolationType.NONE
     current_angle: Optional[float] = None
     limit_value: Optional[float] = None
@@ -101,6 +119,20 @@ class LimitStatus:
     in_warning_zone: bool = False
     message: str = ""
 
+    def _reset(self, current_angle: Optional[float] = None, message: str = ""):
+        """Clear back to a no-violation status for reuse."""
+        self.violation_type = LimitViolationType.NONE
+        self.current_angle = current_angle
+        self.limit_value = None
+        self.axis_error = 0
+        self.protect_flag = 0
+        self.in_warning_zone = False
+        self.message = message
+
+
+# Returned while protection is disabled (shared - do not modify)
+_DISABLED_STATUS = LimitStatus()
+
 
 class LimitProtectionSystem:
     """
@@ -126,6 +158,9 @@ class LimitProtectionSystem:
         self._violation_callbacks: List[Callable] = []
         self._enabled = True
 
+        # Reused LimitStatus per motor, refilled on every check
+        self._status_cache: Dict[str, LimitStatus] = {name: LimitStatus() for name in motors}
+
         # Initialize protection features on motors
         self._initialize_protection()
 
@@ -165,10 +200,10 @@ class LimitProtectionSystem:
             motor_name: Name of motor to check
 
         Returns:
-            LimitStatus with current violation status
+            LimitStatus with current violation status (reused on the next check)
         """
         if not self._enabled:
-            return LimitStatus()
+            return _DISABLED_STATUS
 
         if motor_name not in self.motors:
             return LimitStatus(
@@ -177,70 +212,125 @@ class LimitProtectionSystem:
             )
 
         limits = self.motors[motor_name]
-        status = LimitStatus()
-
         try:
-            # Read current position
-            current_angle = self.servo.read_angle_degrees(limits.addr)
-            status.current_angle = current_angle
-
-            # Check software limits
-            if limits.min_angle is not None and current_angle < limits.min_angle:
-                status.violation_type = LimitViolationType.SOFTWARE_MIN
-                status.limit_value = limits.min_angle
-                status.message = f"{motor_name} below minimum: {current_angle:.1f}° < {limits.min_angle:.1f}°"
-                return status
+            raw = self._read_status(limits)
+        except Exception as e:
+            return self._read_failed(motor_name, e)
+        return self._evaluate_status(motor_name, limits, raw)
 
-            if limits.max_angle is not None and current_angle > limits.max_angle:
-                status.violation_type = LimitViolationType.SOFTWARE_MAX
-                status.limit_value = limits.max_angle
-                status.message = f"{motor_name} above maximum: {current_angle:.1f}° > {limits.max_angle:.1f}°"
-                return status
+    def _read_status(self, limits: MotorLimits) -> tuple:
+        """
+        Position, limit inputs, protect flag and axis error.
 
-            # Check warning zones
-            if limits.min_angle is not None:
-                if current_angle < limits.min_angle + limits.warning_margin:
-                    status.in_warning_zone = True
-                    status.message = f"{motor_name} approaching minimum limit"
-
-            if limits.max_angle is not None:
-                if current_angle > limits.max_angle - limits.warning_margin:
-                    status.in_warning_zone = True
-                    status.message = f"{motor_name} approaching maximum limit"
-
-            # Check hardware limits (if applicable)
-            if limits.has_hardware_limits:
-                limit_switches = self.servo.read_limits(limits.addr)
-                if limit_switches.get("in1", False) or limit_switches.get("in2", False):
-                    status.violation_type = LimitViolationType.HARDWARE_LIMIT
-                    status.message = f"{motor_name} hardware limit switch triggered"
-                    return status
-
-            # Check stall/protection status
-            protect_flag = self.servo.read_protect_status(limits.addr)
-            status.protect_flag = protect_flag
-            if protect_flag != 0:  # 0 = protected/stalled, 1 = normal
-                status.violation_type = LimitViolationType.STALL_DETECTED
-                status.message = f"{motor_name} stall protection triggered (flag: {protect_flag})"
-                return status
+        The position is read on its own first. When it is already outside the
+        software limits the other registers are skipped (reported as 0), so a
+        failed follow-up read can't turn that violation into an error status.
+        """
+        angle = self.servo.read_angle_degrees(limits.addr)
+        if angle < limits._eff_min or angle > limits._eff_max:
+            return angle, 0, 0, 0
+        return (angle,) + self.servo.read_status_bundle(limits.addr, with_io=limits.has_hardware_limits)
+
+    def _cached_status(self, motor_name: str) -> LimitStatus:
+        """The reusable status object for a motor."""
+        status = self._status_cache.get(motor_name)
+        if status is None:
+            status = self._status_cache[motor_name] = LimitStatus()
+        return status
+
+    def _read_failed(self, motor_name: str, error: Exception) -> LimitStatus:
+        """Status for a motor whose registers could not be read."""
+        logger.error(f"Error checking limits for {motor_name}: {error}")
+        status = self._cached_status(motor_name)
+        status._reset(message=f"Error checking limits: {error}")
+        return status
+
+    def _evaluate_status(self, motor_name: str, limits: MotorLimits, raw: tuple) -> LimitStatus:
+        """
+        Run the violation checks on values returned by _read_status.
+
+        Args:
+            motor_name: Name of motor
+            limits: Its limit configuration
+            raw: (angle_deg, limit_bits, protect_flag, axis_error)
 
-            # Check position following error
-            axis_error = self.servo.read_axis_error(limits.addr)
-            status.axis_error = axis_error
-            if abs(axis_error) > limits.max_following_error:
-                status.violation_type = LimitViolationType.FOLLOWING_ERROR
-                status.message = f"{motor_name} following error too large: {axis_error} ticks"
+        Returns:
+            LimitStatus with current violation status
+        """
+        current_angle, lim_bits, protect_flag, axis_error = raw
+        status = self._cached_status(motor_name)
+        status._reset(current_angle)
+
+        # Check software limits
+        if current_angle < limits._eff_min:
+            status.violation_type = LimitViolationType.SOFTWARE_MIN
+            status.limit_value = limits.min_angle
+            status.message = f"{motor_name} below minimum: {current_angle:.1f}° < {limits.min_angle:.1f}°"
+            return status
+
+        if current_angle > limits._eff_max:
+            status.violation_type = LimitViolationType.SOFTWARE_MAX
+            status.limit_value = limits.max_angle
+            status.message = f"{motor_name} above maximum: {current_angle:.1f}° > {limits.max_angle:.1f}°"
+            return status
+
+        # Check warning zones
+        if current_angle < limits._warn_min:
+            status.in_warning_zone = True
+            status.message = f"{motor_name} approaching minimum limit"
+
+        if current_angle > limits._warn_max:
+            status.in_warning_zone = True
+            status.message = f"{motor_name} approaching maximum limit"
+
+        # Check hardware limits (if applicable)
+        if limits.has_hardware_limits:
+            if lim_bits & 0x03:  # IN1 or IN2 pressed
+                status.violation_type = LimitViolationType.HARDWARE_LIMIT
+                status.message = f"{motor_name} hardware limit switch triggered"
                 return status
 
-        except Exception as e:
-            logger.error(f"Error checking limits for {motor_name}: {e}")
-            status.message = f"Error checking limits: {e}"
+        # Check stall/protection status
+        status.protect_flag = protect_flag
+        if protect_flag != 0:  # 0 = protected/stalled, 1 = normal
+            status.violation_type = LimitViolationType.STALL_DETECTED
+            status.message = f"{motor_name} stall protection triggered (flag: {protect_flag})"
+            return status
+
+        # Check position following error
+        status.axis_error = axis_error
+        if abs(axis_error) > limits.max_following_error:
+            status.violation_type = LimitViolationType.FOLLOWING_ERROR
+            status.message = f"{motor_name} following error too large: {axis_error} ticks"
+            return status
 
         return status
 
     def check_all_motors(self) -> Dict[str, LimitStatus]:
-        """Check limits for all motors."""
-        return {name: self.check_limits(name) for name in self.motors.keys()}
+        """
+        Check limits for all motors.
+
+        Every motor is read first, back-to-back on the bus, and only then are
+        the readings evaluated, so the samples are as close together in time
+        as the half-duplex bus allows.
+        """
+        if not self._enabled:
+            return dict.fromkeys(self.motors, _DISABLED_STATUS)
+
+        readings: Dict[str, Union[tuple, Exception]] = {}
+        for name, limits in self.motors.items():
+            try:
+                readings[name] = self._read_status(limits)
+            except Exception as e:
+                readings[name] = e
+
+        results = {}
+        for name, raw in readings.items():
+            if isinstance(raw, Exception):
+                results[name] = self._read_failed(name, raw)
+            else:
+                results[name] = self._evaluate_status(name, self.motors[name], raw)
+        return results
 
     def validate_move(self, motor_name: str, target_angle: float) -> tuple[bool, str]:
         """
@@ -259,10 +349,10 @@ class LimitProtectionSystem:
         limits = self.motors[motor_name]
 
         # Check software limits
-        if limits.min_angle is not None and target_angle < limits.min_angle:
+        if target_angle < limits._eff_min:
             return False, f"Target {target_angle:.1f}° below minimum {limits.min_angle:.1f}°"
 
-        if limits.max_angle is not None and target_angle > limits.max_angle:
+        if target_angle > limits._eff_max:
             return False, f"Target {target_angle:.1f}° above maximum {limits.max_angle:.1f}°"
 
         # Check current limit status
@@ -427,6 +517,7 @@ class LimitProtectionSystem:
             if hasattr(limits, key):
                 setattr(limits, key, value)
                 logger.info(f"Updated {motor_name}.{key} = {value}")
+        limits.__post_init__()  # refresh precomputed bounds
 
         # Re-initialize if protection settings changed
         if any(k in kwargs for k in ['stall_detection_enabled', 'hardware_limits_enabled', 'max_following_error']):
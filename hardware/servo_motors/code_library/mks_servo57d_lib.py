@@ -101,26 +101,33 @@ class MKSChecksumError(Exception): ...
 def _checksum8(data: bytes) -> int:
     return sum(data) & 0xFF
 
+# Big-endian field codecs, compiled once instead of re-parsing the format per call
+_U16 = struct.Struct(">H")
+_I16 = struct.Struct(">h")
+_U32 = struct.Struct(">I")
+_I32 = struct.Struct(">i")
+
 def _pack_u16(x: int) -> bytes:
-    return struct.pack(">H", x & 0xFFFF)
+    return _U16.pack(x & 0xFFFF)
 
 def _pack_i16(x: int) -> bytes:
-    return struct.pack(">h", int(x))
+    return _I16.pack(int(x))
 
 def _pack_u32(x: int) -> bytes:
-    return struct.pack(">I", x & 0xFFFFFFFF)
+    return _U32.pack(x & 0xFFFFFFFF)
 
 def _pack_i32(x: int) -> bytes:
-    return struct.pack(">i", int(x))
+    return _I32.pack(int(x))
 
-def _unpack_u16(b: bytes) -> int:
-    return struct.unpack(">H", b)[0]
+# Unpack in place at byte offset `off` of a reply frame (no slice of the field)
+def _unpack_u16(b: bytes, off: int = 0) -> int:
+    return _U16.unpack_from(b, off)[0]
 
-def _unpack_i16(b: bytes) -> int:
-    return struct.unpack(">h", b)[0]
+def _unpack_i16(b: bytes, off: int = 0) -> int:
+    return _I16.unpack_from(b, off)[0]
 
-def _unpack_i32(b: bytes) -> int:
-    return struct.unpack(">i", b)[0]
+def _unpack_i32(b: bytes, off: int = 0) -> int:
+    return _I32.unpack_from(b, off)[0]
 
 def degrees_to_axis_ticks(deg: float) -> int:
     return int(round((deg / 360.0) * TICKS_PER_REV))
@@ -128,6 +135,13 @@ def degrees_to_axis_ticks(deg: float) -> int:
 def axis_ticks_to_degrees(axis: int) -> float:
     return (axis / TICKS_PER_REV) * 360.0
 
+_LIMIT_MASK = int(IOFlags.IN1 | IOFlags.IN2)  # plain int: IntFlag arithmetic is slow
+
+def _limit_bits(io: int, inputs_active_low: bool = True) -> int:
+    """0x34 IO byte -> active limit inputs: bit0 = IN1, bit1 = IN2."""
+    bits = io & _LIMIT_MASK
+    return bits ^ _LIMIT_MASK if inputs_active_low else bits
+
 
 # ===== Expected reply lengths (defensive defaults) =====
 # Note: Many commands ACK with a single status byte (total length 5).
@@ -261,7 +275,7 @@ class MKSServo57D:
 
     def read_encoder_carry(self, addr: int) -> EncoderCarry:
         f = self._xfer(addr, 0x30)
-        return EncoderCarry(carry=_unpack_i32(f[3:7]), value=_unpack_u16(f[7:9]))
+        return EncoderCarry(carry=_unpack_i32(f, 3), value=_unpack_u16(f, 7))
 
     def read_encoder_addition(self, addr: int) -> int:
         f = self._xfer(addr, 0x31)
@@ -273,15 +287,15 @@ class MKSServo57D:
 
     def read_speed_rpm(self, addr: int) -> int:
         f = self._xfer(addr, 0x32)
-        return _unpack_i16(f[3:5])
+        return _unpack_i16(f, 3)
 
     def read_pulses(self, addr: int) -> int:
         f = self._xfer(addr, 0x33)
-        return _unpack_i32(f[3:7])
+        return _unpack_i32(f, 3)
 
     def read_axis_error(self, addr: int) -> int:
         f = self._xfer(addr, 0x39)
-        return _unpack_i32(f[3:7])
+        return _unpack_i32(f, 3)
 
     def read_en_status(self, addr: int) -> int:
         return self._xfer(addr, 0x3A)[3]
@@ -303,6 +317,25 @@ class MKSServo57D:
         f = self._xfer(addr, 0x48)
         return bytes(f[3:-1])  # raw status block
 
+    def read_status_bundle(self, addr: int, with_io: bool = True) -> Tuple[int, int, int]:
+        """
+        The status registers a limit check reads after the position, in one call:
+          (active limit bits as read_limits_bits [0x34] or 0 if not with_io,
+           protect flag [0x3E], axis error [0x39])
+        The bus is half-duplex, so each query still waits for its reply before the
+        next goes out; the input buffer is cleared once for the whole sequence.
+        """
+        self.ser.reset_input_buffer()
+        lim_bits = _limit_bits(self._query(addr, 0x34)[3]) if with_io else 0
+        protect = self._query(addr, 0x3E)[3]
+        axis_err = _unpack_i32(self._query(addr, 0x39), 3)
+        return lim_bits, protect, axis_err
+
+    def _query(self, addr: int, code: int) -> bytes:
+        """Request/reply for a data-less read, without the per-call input flush of _xfer."""
+        self.ser.write(self._frame(addr, code))
+        return self._recv(expect_code=code, expect_addr=addr)
+
     def read_version_info(self, addr: int) -> bytes:
         """
         0x40: Return hardware/firmware info. Payload format varies by build.
@@ -545,24 +578,22 @@ class MKSServo57D:
         out2 = bool(flags & IOFlags.OUT2)
         return {"IN1": in1, "IN2": in2, "OUT1": out1, "OUT2": out2}
 
+    def read_limits_bits(self, addr: int, inputs_active_low: bool = True) -> int:
+        """
+        Read limit switch states from 0x34 (IO flags) as a bitmask:
+        bit0 = IN1, bit1 = IN2, set when that input is ACTIVE (pressed).
+        Set inputs_active_low=False if your switches are active-high.
+        """
+        return _limit_bits(self._xfer(addr, 0x34)[3], inputs_active_low)
+
     def read_limits(self, addr: int, inputs_active_low: bool = True) -> Dict[str, bool]:
         """
         Read limit switch states from 0x34 (IO flags).
         Returns True when the corresponding input is ACTIVE (pressed).
         Set inputs_active_low=False if your switches are active-high.
         """
-        flags = self.read_io(addr)  # IOFlags bitfield
-        raw_in1 = bool(flags & IOFlags.IN1)
-        raw_in2 = bool(flags & IOFlags.IN2)
-
-        if inputs_active_low:
-            in1 = not raw_in1
-            in2 = not raw_in2
-        else:
-            in1 = raw_in1
-            in2 = raw_in2
-
-        return {"in1": in1, "in2": in2}
+        bits = self.read_limits_bits(addr, inputs_active_low)
+        return {"in1": bool(bits & IOFlags.IN1), "in2": bool(bits & IOFlags.IN2)}
 
 
     # ===== MOTION =====
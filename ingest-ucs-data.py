@@ -55,28 +55,61 @@ def clean_number(value):
     except (ValueError, TypeError):
         return None
 
+# UCS column header and value cleaner for each metadata field
+UCS_FIELDS = {
+    'purpose': ('Purpose', clean_string),
+    'detailed_purpose': ('Detailed Purpose', clean_string),
+    'users': ('Users', clean_string),
+
+    'country_of_operator': ('Country of Operator/Owner', clean_string),
+    'operator_owner': ('Operator/Owner', clean_string),
+    'country_un_registry': ('Country/Org of UN Registry', clean_string),
+
+    'launch_mass_kg': ('Launch Mass (kg.)', clean_number),
+    'dry_mass_kg': ('Dry Mass (kg.)', clean_number),
+    'power_watts': ('Power (watts)', clean_number),
+    'expected_lifetime_yrs': ('Expected Lifetime (yrs.)', clean_number),
+
+    'launch_vehicle': ('Launch Vehicle', clean_string),
+    'launch_site': ('Launch Site', clean_string),
+    'contractor': ('Contractor', clean_string),
+    'country_of_contractor': ('Country of Contractor', clean_string),
+
+    'ucs_orbit_class': ('Class of Orbit', clean_string),
+    'ucs_orbit_type': ('Type of Orbit', clean_string),
+    'ucs_longitude_geo': ('Longitude of GEO (degrees)', clean_number),
+
+    'cospar_number': ('COSPAR Number', clean_string),
+    'comments': ('Comments', clean_string),
+    'alternate_names': ('Name of Satellite, Alternate Names', clean_string),
+}
+
 def parse_ucs_data():
     """Parse UCS Excel file and return list of satellite records"""
     print(f"Opening UCS database: {UCS_FILE}")
-    workbook = openpyxl.load_workbook(UCS_FILE, data_only=True)
+    workbook = openpyxl.load_workbook(UCS_FILE, data_only=True, read_only=True, keep_links=False)
     sheet = workbook.active
 
-    # Get headers
-    headers = [cell.value for cell in sheet[1]]
+    # Stream rows as value tuples; the first row holds the headers
+    rows = sheet.iter_rows(values_only=True)
+    headers = list(next(rows, ()))
 
-    # Map column names to indices
-    col_map = {header: idx for idx, header in enumerate(headers, 1)}
+    # Map column names to tuple indices once, before the row loop
+    col_map = {header: idx for idx, header in enumerate(headers)}
+    norad_col = col_map.get('NORAD Number')
+    field_cols = [(key, col_map.get(header), clean) for key, (header, clean) in UCS_FIELDS.items()]
 
-    print(f"Found {sheet.max_row - 1:,} satellite records")
     print("Parsing UCS data...")
 
     satellites = []
     skipped = 0
+    next_report = 1000
+    row_num = 1  # header; read-only max_row is None for unsized sheets, so count as we go
 
-    for row_num in range(2, sheet.max_row + 1):
+    for row_num, row in enumerate(rows, 2):
         try:
             # Get NORAD ID (required for matching)
-            norad_id = sheet.cell(row_num, col_map.get('NORAD Number')).value
+            norad_id = row[norad_col] if norad_col is not None else None
 
             if not norad_id:
                 skipped += 1
@@ -85,45 +118,24 @@ def parse_ucs_data():
             norad_id = int(norad_id)
 
             # Extract UCS metadata
-            sat_data = {
-                'norad_id': norad_id,
-                'purpose': clean_string(sheet.cell(row_num, col_map.get('Purpose')).value),
-                'detailed_purpose': clean_string(sheet.cell(row_num, col_map.get('Detailed Purpose')).value),
-                'users': clean_string(sheet.cell(row_num, col_map.get('Users')).value),
-
-                'country_of_operator': clean_string(sheet.cell(row_num, col_map.get('Country of Operator/Owner')).value),
-                'operator_owner': clean_string(sheet.cell(row_num, col_map.get('Operator/Owner')).value),
-                'country_un_registry': clean_string(sheet.cell(row_num, col_map.get('Country/Org of UN Registry')).value),
-
-                'launch_mass_kg': clean_number(sheet.cell(row_num, col_map.get('Launch Mass (kg.)')).value),
-                'dry_mass_kg': clean_number(sheet.cell(row_num, col_map.get('Dry Mass (kg.)')).value),
-                'power_watts': clean_number(sheet.cell(row_num, col_map.get('Power (watts)')).value),
-                'expected_lifetime_yrs': clean_number(sheet.cell(row_num, col_map.get('Expected Lifetime (yrs.)')).value),
-
-                'launch_vehicle': clean_string(sheet.cell(row_num, col_map.get('Launch Vehicle')).value),
-                'launch_site': clean_string(sheet.cell(row_num, col_map.get('Launch Site')).value),
-                'contractor': clean_string(sheet.cell(row_num, col_map.get('Contractor')).value),
-                'country_of_contractor': clean_string(sheet.cell(row_num, col_map.get('Country of Contractor')).value),
-
-                'ucs_orbit_class': clean_string(sheet.cell(row_num, col_map.get('Class of Orbit')).value),
-                'ucs_orbit_type': clean_string(sheet.cell(row_num, col_map.get('Type of Orbit')).value),
-                'ucs_longitude_geo': clean_number(sheet.cell(row_num, col_map.get('Longitude of GEO (degrees)')).value),
-
-                'cospar_number': clean_string(sheet.cell(row_num, col_map.get('COSPAR Number')).value),
-                'comments': clean_string(sheet.cell(row_num, col_map.get('Comments')).value),
-                'alternate_names': clean_string(sheet.cell(row_num, col_map.get('Name of Satellite, Alternate Names')).value),
-            }
+            sat_data = {'norad_id': norad_id}
+            for key, col, clean in field_cols:
+                sat_data[key] = clean(row[col] if col is not None else None)
 
             satellites.append(sat_data)
 
-            if row_num % 1000 == 0:
+            if row_num >= next_report:
                 print(f"  Processed {row_num - 1:,} rows...")
+                next_report += 1000
 
         except Exception as e:
             print(f"  Warning: Error processing row {row_num}: {e}")
             skipped += 1
             continue
 
+    workbook.close()
+
+    print(f"Found {row_num - 1:,} satellite records")
     print(f"Parsed {len(satellites):,} satellite records")
     if skipped > 0:
         print(f"Skipped {skipped} records (missing NORAD ID or errors)")